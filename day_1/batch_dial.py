@@ -0,0 +1,70 @@
+from __future__ import annotations
+from itertools import accumulate
+from time import perf_counter
+
+# Batch dial engine: part1.py and part2.py create a new WrappedInt on every rotation
+# (part 2 even does it twice), which dominates the runtime on long rotation logs.
+#
+# Instead, we parse the whole log into a list of signed deltas (R = +, L = -) and work
+# on the *unwrapped* running position S_i = 50 + d_1 + ... + d_i (a prefix sum).
+# Wrapping is then just S_i % 100, and the number of times the dial points at 0 during
+# a rotation is the number of multiples of 100 it passes over, which floor division
+# gives us directly:
+#   R (S_prev -> S):  multiples of 100 in (S_prev, S]  =  S // 100 - S_prev // 100
+#   L (S_prev -> S):  multiples of 100 in [S, S_prev)  =  (S_prev - 1) // 100 - (S - 1) // 100
+#
+# This matches the branchy logic in part2.py exactly, including the correction for
+# negative wraps from a non-zero start (which is what the "- 1" above takes care of).
+
+DIAL_SIZE: int = 100
+START_POSITION: int = 50
+
+
+def parse_rotations(lines) -> list[int]:
+    """Convert rotation lines ("L68", "R48", ...) into signed deltas"""
+    deltas: list[int] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        count = int(line[1:])
+        deltas.append(count if line[:1] in ("R", b"R") else -count)
+    return deltas
+
+
+def count_zero_hits(deltas: list[int], start: int = START_POSITION) -> tuple[int, int, int]:
+    """
+    Replay the deltas from start and return (final position, zero landings, zero crossings).
+
+    Zero landings is the part 1 password (rotations ending exactly on 0), zero crossings
+    is the part 2 password (every click that points at 0, including landings).
+    """
+    zero_landings = 0
+    zero_crossings = 0
+    positions = list(accumulate(deltas, initial=start))
+    for delta, previous, current in zip(deltas, positions, positions[1:]):
+        if delta > 0:
+            zero_crossings += current // DIAL_SIZE - previous // DIAL_SIZE
+        elif delta < 0:
+            zero_crossings += (previous - 1) // DIAL_SIZE - (current - 1) // DIAL_SIZE
+        elif current % DIAL_SIZE == 0:
+            # A zero-length rotation while sat on 0 still counts in part2.py
+            zero_crossings += 1
+        if current % DIAL_SIZE == 0:
+            zero_landings += 1
+    return positions[-1] % DIAL_SIZE, zero_landings, zero_crossings
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("day_1/input.txt", "r") as file:
+        deltas = parse_rotations(file)
+
+    start_time = perf_counter()
+    final_position, zero_landings, zero_crossings = count_zero_hits(deltas)
+    end_time = perf_counter()
+
+    print(f"Batch Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Final position: {final_position}")
+    print(f"Password (part 1): {zero_landings}")
+    print(f"Password (part 2): {zero_crossings}")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from time import perf_counter
+
+import numpy as np
+
+from batch_dial import DIAL_SIZE, START_POSITION
+
+# NumPy version of batch_dial.py // same prefix sum + floor division idea, but the
+# per-rotation loop is replaced by whole-array operations so the interpreter only
+# runs a handful of times regardless of how many rotations are in the log.
+#
+# The parser hands the numbers to NumPy's own text parser in one go (with the L/R
+# letters deleted first), and takes the sign from the first byte of every line. Apart
+# from the input itself it only allocates one byte-sized mask and a few arrays with one
+# entry per line (no per-byte int64 or float arrays).
+
+NEWLINE: int = ord("\n")
+LEFT: int = ord("L")
+RIGHT: int = ord("R")
+
+
+def parse_rotations_numpy(data: bytes) -> np.ndarray:
+    """Convert a raw rotation log into an int64 array of signed deltas"""
+    # Whitespace separators match any run of whitespace, so blank lines and '\r' are skipped
+    counts = np.fromstring(data.translate(None, b"LR").decode("ascii"), dtype=np.int64, sep="\n")
+
+    # First byte of every line // blank lines (and the one after a final newline) have no letter
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    line_starts = np.concatenate(([0], np.flatnonzero(buffer == NEWLINE) + 1))
+    first_bytes = buffer[line_starts[line_starts < len(buffer)]]
+    directions = first_bytes[(first_bytes == LEFT) | (first_bytes == RIGHT)]
+    if len(directions) != len(counts):
+        raise ValueError("Every non-empty line must be 'L' or 'R' followed by a number")
+
+    return np.where(directions == RIGHT, counts, -counts)
+
+
+def count_zero_hits_numpy(deltas: np.ndarray, start: int = START_POSITION) -> tuple[int, int, int]:
+    """NumPy equivalent of batch_dial.count_zero_hits, returns (final position, landings, crossings)"""
+    if len(deltas) == 0:
+        return start % DIAL_SIZE, 0, 0
+
+    positions = start + np.cumsum(deltas, dtype=np.int64)
+    previous = np.concatenate(([start], positions[:-1]))
+    on_zero = positions % DIAL_SIZE == 0
+
+    # R: multiples of 100 in (previous, current], L: multiples of 100 in [current, previous)
+    right_crossings = np.floor_divide(positions, DIAL_SIZE) - np.floor_divide(previous, DIAL_SIZE)
+    left_crossings = np.floor_divide(previous - 1, DIAL_SIZE) - np.floor_divide(positions - 1, DIAL_SIZE)
+
+    zero_crossings = (
+        int(right_crossings[deltas > 0].sum())
+        + int(left_crossings[deltas < 0].sum())
+        # A zero-length rotation while sat on 0 still counts in part2.py
+        + int(np.count_nonzero(on_zero & (deltas == 0)))
+    )
+    zero_landings = int(np.count_nonzero(on_zero))
+
+    return int(positions[-1] % DIAL_SIZE), zero_landings, zero_crossings
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("day_1/input.txt", "rb") as file:
+        data = file.read()
+
+    start_time = perf_counter()
+    deltas = parse_rotations_numpy(data)
+    final_position, zero_landings, zero_crossings = count_zero_hits_numpy(deltas)
+    end_time = perf_counter()
+
+    print(f"NumPy Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Final position: {final_position}")
+    print(f"Password (part 1): {zero_landings}")
+    print(f"Password (part 2): {zero_crossings}")
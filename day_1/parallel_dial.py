@@ -0,0 +1,128 @@
+from __future__ import annotations
+from functools import reduce
+from multiprocessing import Pool, cpu_count
+from time import perf_counter
+import mmap
+import os
+
+from batch_dial import DIAL_SIZE, START_POSITION, parse_rotations
+
+# Parallel chunked replay of the rotation log.
+#
+# The number of zeros hit within a chunk of rotations only depends on where the dial
+# was when the chunk started, and there are only 100 possible places. So each worker
+# summarises its chunk as (net delta, landings[s], crossings[s]) for every start s,
+# without knowing where the previous chunk left off. The parent then stitches the
+# summaries together in order: the start of chunk k + 1 is the start of chunk k plus
+# its net delta. The merge is associative, so the chunks can be processed in any order.
+#
+# Computing a chunk for all 100 starts doesn't cost 100 replays: each rotation passes
+# zero a fixed number of full turns (|d| // 100) for every start, plus one more for a
+# contiguous (cyclic) range of starts depending on the remainder. Those ranges are
+# added to a difference array, so a chunk costs O(rotations + 100).
+
+Summary = tuple[int, list[int], list[int]]  # (net delta, landings per start, crossings per start)
+
+
+def _add_cyclic_range(diff: list[int], first: int, length: int) -> None:
+    """Add 1 to starts first, first + 1, ..., first + length - 1 (mod DIAL_SIZE)"""
+    last = first + length
+    diff[first] += 1
+    if last <= DIAL_SIZE:
+        diff[last] -= 1
+    else:
+        diff[DIAL_SIZE] -= 1
+        diff[0] += 1
+        diff[last - DIAL_SIZE] -= 1
+
+
+def summarise_deltas(deltas: list[int]) -> Summary:
+    """Summarise a chunk of deltas for every possible starting position of the dial"""
+    landings = [0] * DIAL_SIZE
+    crossing_diff = [0] * (DIAL_SIZE + 1)
+    full_turns = 0
+    net = 0
+
+    # position is the offset from the (unknown) start, kept modulo DIAL_SIZE
+    position = 0
+    for delta in deltas:
+        new_position = (position + delta) % DIAL_SIZE
+        if delta > 0:
+            # Zero is passed once more if (start + position) % 100 is in [100 - r, 99]
+            turns, remainder = divmod(delta, DIAL_SIZE)
+            full_turns += turns
+            if remainder:
+                _add_cyclic_range(crossing_diff, (DIAL_SIZE - remainder - position) % DIAL_SIZE, remainder)
+        elif delta < 0:
+            # Zero is passed once more if (start + new_position) % 100 is in [101 - r, 100]
+            turns, remainder = divmod(-delta, DIAL_SIZE)
+            full_turns += turns
+            if remainder:
+                _add_cyclic_range(crossing_diff, (DIAL_SIZE + 1 - remainder - new_position) % DIAL_SIZE, remainder)
+        else:
+            # A zero-length rotation while sat on 0 still counts in part2.py
+            _add_cyclic_range(crossing_diff, -position % DIAL_SIZE, 1)
+
+        landings[-new_position % DIAL_SIZE] += 1
+        position = new_position
+        net += delta
+
+    crossings: list[int] = []
+    running = full_turns
+    for start in range(DIAL_SIZE):
+        running += crossing_diff[start]
+        crossings.append(running)
+
+    return net, landings, crossings
+
+
+def merge_summaries(first: Summary, second: Summary) -> Summary:
+    """Combine the summaries of two consecutive chunks into one"""
+    first_net, first_landings, first_crossings = first
+    second_net, second_landings, second_crossings = second
+    shift = first_net % DIAL_SIZE
+    return (
+        first_net + second_net,
+        [first_landings[s] + second_landings[(s + shift) % DIAL_SIZE] for s in range(DIAL_SIZE)],
+        [first_crossings[s] + second_crossings[(s + shift) % DIAL_SIZE] for s in range(DIAL_SIZE)],
+    )
+
+
+def process_chunk(args: tuple[str, int, int]) -> Summary:
+    path, start, end = args
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return summarise_deltas(parse_rotations(buffer[start:end].split()))
+
+
+def split_file(path: str, num_chunks: int) -> list[tuple[str, int, int]]:
+    """Split the file into num_chunks byte ranges, each ending on a newline"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunk_size = max(1, size // num_chunks)
+
+    chunks: list[tuple[str, int, int]] = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        current = 0
+        while current < size:
+            chunk_end = buffer.find(b"\n", min(current + chunk_size, size) - 1)
+            chunk_end = size if chunk_end == -1 else chunk_end + 1
+            chunks.append((path, current, chunk_end))
+            current = chunk_end
+    return chunks
+
+
+if __name__ == "__main__":
+    num_workers = cpu_count() * 4  # More chunks than cores to even out the load
+    start_time = perf_counter()
+
+    with Pool() as pool:
+        summaries = pool.map(process_chunk, split_file("day_1/input.txt", num_workers))
+
+    net, landings, crossings = reduce(merge_summaries, summaries, (0, [0] * DIAL_SIZE, [0] * DIAL_SIZE))
+
+    end_time = perf_counter()
+    print(f"Parallel Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Final position: {(START_POSITION + net) % DIAL_SIZE}")
+    print(f"Password (part 1): {landings[START_POSITION]}")
+    print(f"Password (part 2): {crossings[START_POSITION]}")
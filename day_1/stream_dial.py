@@ -0,0 +1,51 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from time import perf_counter
+import mmap
+import os
+
+from batch_dial import START_POSITION, count_zero_hits, parse_rotations
+
+# Streaming version of batch_dial.py for rotation logs too big to hold in memory.
+#
+# part1.py and part2.py call file.readlines(), so every line of the log exists as a
+# Python string at the same time. Here we memory-map input.txt and cut it into fixed
+# size byte blocks (always ending on a newline), decode each block into a chunk of
+# signed deltas and feed it to count_zero_hits, carrying the dial position over to the
+# next chunk. Peak memory is then bounded by BLOCK_SIZE, not by the size of the file.
+
+BLOCK_SIZE: int = 1 << 20  # 1 MiB of input per chunk
+
+
+def iter_rotation_chunks(path: str, block_size: int = BLOCK_SIZE) -> Iterator[list[int]]:
+    """Yield the rotations in path as chunks of signed deltas, one chunk per byte block"""
+    if os.path.getsize(path) == 0:
+        return  # mmap can't map an empty file
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        size = len(buffer)
+        offset = 0
+        while offset < size:
+            # Extend the block up to the next newline so no rotation is split in two
+            block_end = buffer.find(b"\n", min(offset + block_size, size) - 1)
+            block_end = size if block_end == -1 else block_end + 1
+            yield parse_rotations(buffer[offset:block_end].split())
+            offset = block_end
+
+
+if __name__ == "__main__":
+    start_time = perf_counter()
+
+    position = START_POSITION
+    zero_landings = 0
+    zero_crossings = 0
+    for chunk in iter_rotation_chunks("day_1/input.txt"):
+        position, chunk_landings, chunk_crossings = count_zero_hits(chunk, position)
+        zero_landings += chunk_landings
+        zero_crossings += chunk_crossings
+
+    end_time = perf_counter()
+
+    print(f"Streaming Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Final position: {position}")
+    print(f"Password (part 1): {zero_landings}")
+    print(f"Password (part 2): {zero_crossings}")
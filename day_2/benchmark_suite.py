@@ -1,73 +1,319 @@
-import subprocess
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
 import re
+import statistics
+import subprocess
+import sys
+
+from generate_input import OVERLAP_PATTERNS, format_ranges, generate_ranges
+
+DAY_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(DAY_DIR)
+
+# Two-sided 95% Student's t critical values by degrees of freedom (normal value beyond 30)
+T_CRITICAL_95: dict[int, float] = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
 
-def run_benchmark(name: str, command: str, iterations: int = 10) -> float | None:
+@dataclass
+class BenchmarkResult:
+    name: str
+    runs: int
+    mean: float
+    median: float
+    p95: float
+    stddev: float
+    ci_low: float
+    ci_high: float
+    total: str | None  # "Total invalid ID count" printed by the implementation
+
+def summarise(name: str, times: list[float], total: str | None) -> BenchmarkResult:
+    """Compute the statistics for a list of run times"""
+    mean = statistics.fmean(times)
+    stddev = statistics.stdev(times) if len(times) > 1 else 0.0
+    # Nearest-rank 95th percentile
+    p95 = sorted(times)[max(0, math.ceil(0.95 * len(times)) - 1)]
+    # 95% confidence interval of the mean
+    t_value = T_CRITICAL_95.get(len(times) - 1, 1.960)
+    margin = t_value * stddev / math.sqrt(len(times)) if len(times) > 1 else 0.0
+    return BenchmarkResult(
+        name=name, runs=len(times), mean=mean, median=statistics.median(times), p95=p95,
+        stddev=stddev, ci_low=mean - margin, ci_high=mean + margin, total=total,
+    )
+
+def run_benchmark(name: str, command: list[str], cwd: str, iterations: int = 10, warmup: int = 2) -> BenchmarkResult | None:
     times: list[float] = []
-    print(f"Benchmarking {name} ({iterations} runs)...")
-    
-    for i in range(iterations):
-        # Run command using shell
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        
+    totals: set[str] = set()
+    print(f"Benchmarking {name} ({warmup} warmup + {iterations} runs)...")
+
+    for i in range(warmup + iterations):
+        try:
+            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+        except OSError as error:
+            # Most likely the C/Rust binaries haven't been built
+            print(f"Error running {name}: {error}")
+            return None
+
         if result.returncode != 0:
             print(f"Error running {name}: {result.stderr}")
             return None
-            
+
+        total_match = re.search(r"Total invalid ID count: (\d+)", result.stdout)
+        if total_match:
+            totals.add(total_match.group(1))
+
+        if i < warmup:
+            continue  # Warmup runs only fill caches, their times are discarded
+
         # Extract time
         # Matches:
         # "Execution time: 0.123 seconds" (Serial)
         # "Parallel Execution time: 0.123 seconds" (Parallel)
         match = re.search(r"(?:Execution time|Parallel Execution time): (\d+\.\d+)", result.stdout)
         if match:
-            duration = float(match.group(1))
-            times.append(duration)
+            times.append(float(match.group(1)))
         else:
-            print(f"  Run {i+1}: Could not parse time from output: {result.stdout.strip()[:50]}...")
+            print(f"  Run {i - warmup + 1}: Could not parse time from output: {result.stdout.strip()[:50]}...")
+
+    if len(totals) > 1:
+        print(f"  {name} printed different totals across runs: {sorted(totals)}")
+    if not times:
+        return None
+
+    stats = summarise(name, times, totals.pop() if len(totals) == 1 else None)
+    print(f"{name} Median: {stats.median:.6f} seconds (stddev {stats.stddev:.6f})")
+    return stats
 
-    if times:
-        avg_time = sum(times) / len(times)
-        print(f"{name} Average: {avg_time:.6f} seconds")
-        return avg_time
-    return None
+def write_json(path: str, rows: list[dict]) -> None:
+    with open(path, "w") as file:
+        json.dump(rows, file, indent=2)
 
-print("-" * 45)
+def write_csv(path: str, rows: list[dict]) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+def find_regressions(
+        results: list[BenchmarkResult], baseline_path: str, threshold: float,
+        selected: list[str], allow_missing: bool = False
+    ) -> list[str]:
+    """
+    Compare medians against a stored JSON baseline, returning a message per regression.
+
+    Every selected implementation in the baseline must have a result in this run too,
+    unless allow_missing is set (e.g. when the C/Rust binaries aren't built).
+    """
+    with open(baseline_path, "r") as file:
+        baseline = {entry["name"]: entry for entry in json.load(file)}
+
+    regressions: list[str] = []
+    if not allow_missing:
+        current = {result.name for result in results}
+        for name in baseline:
+            if name in selected and name not in current:
+                regressions.append(f"{name}: in the baseline but has no result in this run")
+    for result in results:
+        if result.name not in baseline:
+            continue
+        baseline_median = baseline[result.name]["median"]
+        if baseline_median > 0 and result.median > baseline_median * (1 + threshold):
+            slowdown = result.median / baseline_median
+            regressions.append(f"{result.name}: {baseline_median:.6f} -> {result.median:.6f} seconds ({slowdown:.2f}x)")
+    return regressions
 
 # List of benchmarks to run
-# Tuples of (Display Name, Shell Command)
-benchmarks = [
-    ("Python", "cd .. && python3 day_2/part1.py"),
-    ("Python (Par)", "python3 part1_parallel.py"),
-    ("C", "cd c && ./bin/main"),
-    ("C (Par)", "cd c && ./bin/main_parallel"),
-    ("Rust", "cd rust && ./target/release/rust"),
-    ("Rust (Par)", "cd rust && ./target/release/parallel")
+# Tuples of (Display Name, Command, Working Directory)
+benchmarks: list[tuple[str, list[str], str]] = [
+    ("Python", [sys.executable, "day_2/part1.py"], REPO_DIR),
+    ("Python (Par)", [sys.executable, "part1_parallel.py"], DAY_DIR),
+    ("C", ["./bin/main"], os.path.join(DAY_DIR, "c")),
+    ("C (Par)", ["./bin/main_parallel"], os.path.join(DAY_DIR, "c")),
+    ("Rust", ["./target/release/rust"], os.path.join(DAY_DIR, "rust")),
+    ("Rust (Par)", ["./target/release/parallel"], os.path.join(DAY_DIR, "rust")),
 ]
 
-raw_results: list[tuple[str, float]] = []
-for name, cmd in benchmarks:
-    avg = run_benchmark(name, cmd)
-    if avg is not None:
-        raw_results.append((name, avg))
-
-print("-" * 45)
-print(f"| {'Language':<15} | {'Avg Time':<10} | {'Speedup':<10} |")
-print("-" * 45)
-
-# Sort results by Average Time (ascending - fastest first)
-results = sorted(raw_results, key=lambda x: x[1])
-
-# Determine baseline for speedup calculation
-# Prefer "Python" (Serial) as baseline (1.0x).
-# If not present, use the slowest execution time as fallback baseline.
-python_entry = next((x for x in results if x[0] == "Python"), None)
-if python_entry:
-    baseline_time = python_entry[1]
-else:
-    # Fallback to slowest if Python serial failed or missing
-    baseline_time = results[-1][1] if results else 1.0
-
-for name, avg in results:
-    speedup = baseline_time / avg if avg > 0 else 0.0
-    print(f"| {name:<15} | {avg:<10.6f} | {f'{speedup:.2f}x':<10} |")
-
-print("-" * 45)
+def selected_names(only: list[str] | None = None) -> list[str]:
+    return [name for name, _, _ in benchmarks if not only or name in only]
+
+def run_suite(iterations: int, warmup: int, only: list[str] | None = None) -> tuple[list[BenchmarkResult], list[str]]:
+    """Run the selected implementations, returning their results and the names of any that failed"""
+    raw_results: list[BenchmarkResult] = []
+    failed: list[str] = []
+    for name, command, cwd in benchmarks:
+        if only and name not in only:
+            continue
+        stats = run_benchmark(name, command, cwd, iterations, warmup)
+        if stats is not None:
+            raw_results.append(stats)
+        else:
+            failed.append(name)
+    return raw_results, failed
+
+def print_table(raw_results: list[BenchmarkResult]) -> None:
+    print("-" * 70)
+    print(f"| {'Language':<15} | {'Median':<10} | {'p95':<10} | {'Stddev':<10} | {'Speedup':<10} |")
+    print("-" * 70)
+
+    # Sort results by median time (ascending - fastest first)
+    results = sorted(raw_results, key=lambda x: x.median)
+
+    # Determine baseline for speedup calculation
+    # Prefer "Python" (Serial) as baseline (1.0x).
+    # If not present, use the slowest execution time as fallback baseline.
+    python_entry = next((x for x in results if x.name == "Python"), None)
+    if python_entry:
+        baseline_time = python_entry.median
+    else:
+        # Fallback to slowest if Python serial failed or missing
+        baseline_time = results[-1].median if results else 1.0
+
+    for result in results:
+        speedup = baseline_time / result.median if result.median > 0 else 0.0
+        print(f"| {result.name:<15} | {result.median:<10.6f} | {result.p95:<10.6f} | {result.stddev:<10.6f} | {f'{speedup:.2f}x':<10} |")
+
+    print("-" * 70)
+
+def run_sweep(
+        spans: list[int], range_counts: list[int], overlaps: list[str], seed: int,
+        iterations: int, warmup: int, only: list[str] | None = None, allow_missing: bool = False
+    ) -> tuple[list[dict], list[str]]:
+    """
+    Benchmark every implementation on generated inputs for each (span, ranges, overlap).
+
+    All implementations read day_2/input.txt, so each generated input is written there
+    in turn and the original input is put back afterwards. Returns the records and a
+    description of every input where the implementations printed different totals
+    (or one of them failed, unless allow_missing is set).
+    """
+    input_path = os.path.join(DAY_DIR, "input.txt")
+    original_input: str | None = None
+    if os.path.exists(input_path):
+        with open(input_path, "r") as file:
+            original_input = file.read()
+
+    records: list[dict] = []
+    mismatches: list[str] = []
+    try:
+        for span, num_ranges, overlap in itertools.product(spans, range_counts, overlaps):
+            print("=" * 70)
+            print(f"Span {span:.0e}, {num_ranges} ranges, {overlap}")
+            print("=" * 70)
+            with open(input_path, "w") as file:
+                file.write(format_ranges(generate_ranges(span, num_ranges, overlap, seed)) + "\n")
+
+            results, failed = run_suite(iterations, warmup, only)
+            if not check_totals(results, failed, allow_missing):
+                mismatches.append(f"span {span:.0e}, {num_ranges} ranges, {overlap}")
+            for result in results:
+                records.append({
+                    "span": span, "ranges": num_ranges, "overlap": overlap, "name": result.name,
+                    "median": result.median, "ids_per_second": span / result.median if result.median > 0 else 0.0,
+                    "total": result.total,
+                })
+    finally:
+        if original_input is not None:
+            with open(input_path, "w") as file:
+                file.write(original_input)
+        else:
+            os.remove(input_path)
+    return records, mismatches
+
+def print_sweep_table(records: list[dict]) -> None:
+    print("-" * 79)
+    print(f"| {'Language':<15} | {'Span':<8} | {'Ranges':<7} | {'Overlap':<11} | {'Median':<10} | {'IDs/sec':<9} |")
+    print("-" * 79)
+    for record in sorted(records, key=lambda x: (x["name"], x["span"], x["ranges"], x["overlap"])):
+        print(
+            f"| {record['name']:<15} | {record['span']:<8.0e} | {record['ranges']:<7} | {record['overlap']:<11} "
+            f"| {record['median']:<10.6f} | {record['ids_per_second']:<9.2e} |"
+        )
+    print("-" * 79)
+
+def check_totals(results: list[BenchmarkResult], failed: list[str], allow_missing: bool = False) -> bool:
+    """Check every implementation ran and printed the same total (failures are only skipped with allow_missing)"""
+    if failed:
+        if not allow_missing:
+            print(f"✗ Implementations failed to run: {', '.join(failed)}")
+            return False
+        print(f"  Skipping implementations that failed to run: {', '.join(failed)}")
+    totals = {result.total for result in results}
+    if len(totals) == 1 and None not in totals:
+        print(f"✓ All implementations produce the same result: {totals.pop()}")
+        return True
+    print("✗ WARNING: Different results detected!")
+    for result in results:
+        print(f"  {result.name}: {result.total}")
+    return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the day 2 implementations")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed runs per implementation")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed runs before timing starts")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--csv", help="Write results to this CSV file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed median slowdown vs baseline (0.10 = 10%%)")
+    parser.add_argument("--only", help="Comma separated implementation names to run (e.g. 'C,Rust')")
+    parser.add_argument("--allow-missing", action="store_true", help="Don't fail when an implementation can't run (e.g. C/Rust not built)")
+    parser.add_argument("--sweep-spans", help="Sweep generated inputs with these total ID spans (e.g. '1e6,1e8,1e10')")
+    parser.add_argument("--sweep-ranges", default="30", help="Range counts to sweep (e.g. '10,100')")
+    parser.add_argument("--sweep-overlaps", default="disjoint", help=f"Overlap patterns to sweep ({', '.join(OVERLAP_PATTERNS)})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated inputs")
+    args = parser.parse_args()
+    only = args.only.split(",") if args.only else None
+
+    if args.sweep_spans:
+        if args.baseline:
+            # Baselines are keyed by implementation name only, so there's nothing to match sweep points against
+            parser.error("--baseline can't be combined with --sweep-spans")
+        records, mismatches = run_sweep(
+            [int(float(span)) for span in args.sweep_spans.split(",")],
+            [int(count) for count in args.sweep_ranges.split(",")],
+            args.sweep_overlaps.split(","),
+            args.seed, args.iterations, args.warmup, only, args.allow_missing,
+        )
+        print_sweep_table(records)
+        if args.json:
+            write_json(args.json, records)
+        if args.csv:
+            write_csv(args.csv, records)
+        if mismatches:
+            print("✗ Different results or failed implementations for:")
+            for mismatch in mismatches:
+                print(f"  {mismatch}")
+        sys.exit(1 if mismatches else 0)
+
+    print("-" * 70)
+    raw_results, failed = run_suite(args.iterations, args.warmup, only)
+    print_table(raw_results)
+    totals_match = check_totals(raw_results, failed, args.allow_missing)
+
+    if args.json:
+        write_json(args.json, [asdict(result) for result in raw_results])
+    if args.csv:
+        write_csv(args.csv, [asdict(result) for result in raw_results])
+
+    regressions: list[str] = []
+    if args.baseline:
+        regressions = find_regressions(
+            raw_results, args.baseline, args.threshold, selected_names(only), args.allow_missing
+        )
+        if regressions:
+            print(f"✗ Regressions against the baseline (slower than {args.threshold:.0%} or missing):")
+            for regression in regressions:
+                print(f"  {regression}")
+        else:
+            print(f"✓ No regressions beyond {args.threshold:.0%} of baseline")
+
+    if not totals_match or regressions:
+        sys.exit(1)
@@ -0,0 +1,88 @@
+from time import perf_counter
+
+# Digit-pattern enumeration: instead of checking every number in every range, generate
+# the invalid IDs directly.
+#
+# An L-digit number made of a k-digit block repeated m = L / k times is
+#   block * multiplier,   multiplier = 10^(k(m-1)) + ... + 10^k + 1   (e.g. 1001, 10101)
+# so the invalid IDs of that shape inside [start, end] are multiplier * block for every
+# k-digit block in [ceil(start / multiplier), end // multiplier]. That's an arithmetic
+# series, so its sum is closed form and the runtime no longer depends on range width.
+#
+# Part 1 only wants two repeats (m = 2), i.e. k = L / 2 for even L.
+# Part 2 wants *any* number of repeats. A number with block length d also has block
+# length 2d, 3d, ... (if they divide L), so summing over every divisor would count
+# numbers more than once. Inclusion-exclusion over the divisors of L fixes that: the
+# numbers with some proper block length are
+#   sum over d | L, d < L of  -mu(L / d) * S(d)
+# where S(d) is the sum of numbers built from a d-digit block and mu is the Mobius function.
+
+
+def repeat_multiplier(block_length: int, repeats: int) -> int:
+    """1, 1001, 10101, ... // the number 'block' is multiplied by to repeat it"""
+    return (10 ** (block_length * repeats) - 1) // (10 ** block_length - 1)
+
+
+def sum_repeated(start: int, end: int, block_length: int, repeats: int) -> int:
+    """Sum of the numbers in [start, end] made of a block_length-digit block repeated repeats times"""
+    multiplier = repeat_multiplier(block_length, repeats)
+    lowest = max(10 ** (block_length - 1), -(-start // multiplier))
+    highest = min(10 ** block_length - 1, end // multiplier)
+    if lowest > highest:
+        return 0
+    return multiplier * (lowest + highest) * (highest - lowest + 1) // 2
+
+
+def mobius(n: int) -> int:
+    """Mobius function (0 if n has a squared prime factor, else (-1)^(number of prime factors))"""
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    return -result if n > 1 else result
+
+
+def invalid_sum_part1(start: int, end: int) -> int:
+    """Sum of the numbers in [start, end] that are a block repeated exactly twice"""
+    total = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        if length % 2 == 0:
+            total += sum_repeated(start, end, length // 2, 2)
+    return total
+
+
+def invalid_sum_part2(start: int, end: int) -> int:
+    """Sum of the numbers in [start, end] that are a block repeated at least twice"""
+    total = 0
+    for length in range(max(2, len(str(start))), len(str(end)) + 1):
+        for block_length in range(1, length):
+            if length % block_length == 0:
+                total -= mobius(length // block_length) * sum_repeated(start, end, block_length, length // block_length)
+    return total
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("day_2/input.txt", "r") as file:
+        line = file.readline().strip()
+
+    start_time = perf_counter()
+
+    total_invalid = 0
+    total_invalid_part2 = 0
+    for id_range in line.split(","):
+        assert "-" in id_range
+        start, end = map(int, id_range.split("-"))
+        total_invalid += invalid_sum_part1(start, end)
+        total_invalid_part2 += invalid_sum_part2(start, end)
+
+    end_time = perf_counter()
+    print(f"Execution time: {end_time - start_time:.6f} seconds")
+
+    print(f"Total invalid ID count: {total_invalid}")
+    print(f"Total invalid ID count (part 2): {total_invalid_part2}")
@@ -0,0 +1,74 @@
+from __future__ import annotations
+import argparse
+import random
+import sys
+
+# Seeded synthetic input generator for stress testing the day 2 implementations.
+#
+# Produces a single "start-end,start-end,..." line like the puzzle input, where the
+# widths of all ranges add up to the requested total span (the number of IDs the range
+# scanning implementations have to check), split over the requested number of ranges.
+#
+# Overlap patterns:
+#   disjoint     ranges follow each other with random gaps (like the real input)
+#   overlapping  each range starts inside the previous one
+#   nested       every range sits inside the widest one
+
+OVERLAP_PATTERNS: tuple[str, ...] = ("disjoint", "overlapping", "nested")
+
+
+def split_span(span: int, num_ranges: int, rng: random.Random) -> list[int]:
+    """Randomly split span into num_ranges widths (each at least 1) that add up to span"""
+    if num_ranges > span:
+        raise ValueError("Can't have more ranges than IDs in the span")
+    cuts = sorted(rng.sample(range(1, span), num_ranges - 1))
+    return [end - start for start, end in zip([0] + cuts, cuts + [span])]
+
+
+def generate_ranges(
+        span: int, num_ranges: int, overlap: str = "disjoint", seed: int = 0, first_id: int = 1
+    ) -> list[tuple[int, int]]:
+    """Generate num_ranges (start, end) ranges covering span IDs in total"""
+    if overlap not in OVERLAP_PATTERNS:
+        raise ValueError(f"Unknown overlap pattern: {overlap}")
+    rng = random.Random(seed)
+    widths = split_span(span, num_ranges, rng)
+
+    ranges: list[tuple[int, int]] = []
+    if overlap == "nested":
+        widest = max(widths)
+        for width in widths:
+            start = first_id + rng.randint(0, widest - width)
+            ranges.append((start, start + width - 1))
+        return ranges
+
+    start = first_id
+    for width in widths:
+        ranges.append((start, start + width - 1))
+        if overlap == "disjoint":
+            start += width + rng.randint(0, width)
+        else:  # overlapping
+            start += max(1, width - rng.randint(1, width))
+    return ranges
+
+
+def format_ranges(ranges: list[tuple[int, int]]) -> str:
+    return ",".join(f"{start}-{end}" for start, end in ranges)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic day 2 input")
+    parser.add_argument("--span", type=float, default=1e6, help="Total number of IDs across all ranges (e.g. 1e6 to 1e12)")
+    parser.add_argument("--ranges", type=int, default=30, help="Number of ranges")
+    parser.add_argument("--overlap", choices=OVERLAP_PATTERNS, default="disjoint", help="How ranges are laid out")
+    parser.add_argument("--first-id", type=int, default=1, help="Lowest ID in the generated ranges")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    line = format_ranges(generate_ranges(int(args.span), args.ranges, args.overlap, args.seed, args.first_id))
+    if args.output == "-":
+        sys.stdout.write(line + "\n")
+    else:
+        with open(args.output, "w") as file:
+            file.write(line + "\n")
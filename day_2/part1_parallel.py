@@ -1,47 +1,115 @@
 from time import perf_counter
 from multiprocessing import Pool, cpu_count
+import argparse
+import random
 
-def process_chunk(args: tuple[int, int]) -> int:
-    start, end = args
+from repetition import HALF_MULTIPLIERS, digit_segments
+
+def process_chunk(pieces: list[tuple[int, int]]) -> int:
     invalid_count = 0
-    for number in range(start, end + 1):
-        s = str(number)
-        if len(s) % 2 != 0:
-            continue
-        mid = len(s) // 2
-        if s[:mid] == s[mid:]:
-            invalid_count += number
+    for start, end in pieces:
+        for length, segment_start, segment_end in digit_segments(start, end):
+            multiplier = HALF_MULTIPLIERS[length]
+            if multiplier is None:
+                continue  # Odd number of digits, can't be a block repeated twice
+            for number in range(segment_start, segment_end + 1):
+                if number % multiplier == 0:
+                    invalid_count += number
     return invalid_count
 
-def split_range(id_range: str, num_chunks: int) -> list[tuple[int, int]]:
-    """Split a range into num_chunks smaller ranges"""
-    start, end = map(int, id_range.split("-"))
-    total = end - start + 1
-    chunk_size = max(1, total // num_chunks)
-    
-    chunks: list[tuple[int, int]] = []
-    current = start
-    while current <= end:
-        chunk_end = min(current + chunk_size - 1, end)
-        chunks.append((current, chunk_end))
-        current = chunk_end + 1
+def segment_cost(length: int, start: int, end: int) -> int:
+    """Estimated work for a digit segment // odd-length segments are skipped outright"""
+    return end - start + 1 if HALF_MULTIPLIERS[length] is not None else 1
+
+def schedule_chunks(id_ranges: list[tuple[int, int]], num_chunks: int) -> list[list[tuple[int, int]]]:
+    """
+    Split all ranges into num_chunks chunks of roughly equal cost.
+
+    A chunk is a list of (start, end) pieces and may span several input ranges, so tiny
+    ranges get grouped together and huge ranges get spread over many chunks.
+    """
+    segments = [segment for start, end in id_ranges for segment in digit_segments(start, end)]
+    total_cost = sum(segment_cost(*segment) for segment in segments)
+    target_cost = max(1, -(-total_cost // num_chunks))
+
+    chunks: list[list[tuple[int, int]]] = []
+    current_chunk: list[tuple[int, int]] = []
+    current_cost = 0
+    for length, start, end in segments:
+        if HALF_MULTIPLIERS[length] is None:
+            # Costs (almost) nothing, just tag it onto the current chunk
+            current_chunk.append((start, end))
+            current_cost += 1
+        else:
+            while start <= end:
+                take = min(end - start + 1, target_cost - current_cost)
+                current_chunk.append((start, start + take - 1))
+                current_cost += take
+                start += take
+                if current_cost >= target_cost:
+                    chunks.append(current_chunk)
+                    current_chunk, current_cost = [], 0
+        # Tagged-on segments count towards the target too, so a chunk is never left over it
+        # (that would make take <= 0 and walk start backwards)
+        if current_cost >= target_cost:
+            chunks.append(current_chunk)
+            current_chunk, current_cost = [], 0
+    if current_chunk:
+        chunks.append(current_chunk)
     return chunks
 
+def brute_force_total(id_ranges: list[tuple[int, int]]) -> int:
+    """Sum of the invalid IDs, one string comparison per number (as in part1.py)"""
+    total = 0
+    for start, end in id_ranges:
+        for number in range(start, end + 1):
+            digits = str(number)
+            if len(digits) % 2 == 0 and digits[:len(digits) // 2] == digits[len(digits) // 2:]:
+                total += number
+    return total
+
+def check_schedule(trials: int, seed: int = 0) -> int:
+    """Compare schedule_chunks + process_chunk against brute force on random range sets, return the mismatches"""
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(trials):
+        id_ranges = []
+        for _ in range(rng.randint(1, 10)):
+            start = rng.randint(1, 10 ** rng.randint(1, 5))
+            id_ranges.append((start, start + rng.randint(0, 2000)))
+        num_chunks = rng.randint(1, 200)
+        chunks = schedule_chunks(id_ranges, num_chunks)
+        scheduled = sum(process_chunk(chunk) for chunk in chunks)
+        expected = brute_force_total(id_ranges)
+        if scheduled != expected:
+            mismatches += 1
+            print(f"Mismatch for {id_ranges} in {num_chunks} chunks: {scheduled} != {expected}")
+    return mismatches
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 2 part 1 using a process pool")
+    parser.add_argument("--workers", type=int, default=cpu_count(), help="Number of worker processes")
+    parser.add_argument("--tasks-per-worker", type=int, default=4, help="Equal-cost chunks scheduled per worker")
+    parser.add_argument("--chunksize", type=int, default=1, help="Chunks sent to a worker at a time (imap_unordered)")
+    parser.add_argument("--check", type=int, metavar="TRIALS", help="Check the scheduler against brute force on random ranges, then exit")
+    args = parser.parse_args()
+
+    if args.check is not None:
+        mismatches = check_schedule(args.check)
+        print(f"Scheduler check: {args.check - mismatches}/{args.check} range sets match brute force")
+        raise SystemExit(1 if mismatches else 0)
+
     file = open("./input.txt", "r")
     line = file.readline().strip()
 
-    # Fine-grained approach // split all ranges into smaller chunks
-    num_workers = cpu_count() * 4  # Adjust multiplier as needed ?
+    # Cost-aware approach // estimate the total work up front and cut it into equal-cost
+    # chunks that can cross range boundaries, rather than slicing every range the same way
     start_time_fine = perf_counter()
-    all_chunks: list[tuple[int, int]] = []
-    for id_range in line.split(","):
-        all_chunks.extend(split_range(id_range, num_workers))
-    
-    
-    with Pool() as pool:
-        results = pool.map(process_chunk, all_chunks)
-    total_fine = sum(results)
+    id_ranges = [tuple(map(int, id_range.split("-"))) for id_range in line.split(",")]
+    all_chunks = schedule_chunks(id_ranges, args.workers * args.tasks_per_worker)
+
+    with Pool(args.workers) as pool:
+        total_fine = sum(pool.imap_unordered(process_chunk, all_chunks, chunksize=args.chunksize))
     end_time_fine = perf_counter()
     print(f"Parallel Execution time: {end_time_fine - start_time_fine:.6f} seconds")
-    print(f"Total invalid ID count: {total_fine}")
\ No newline at end of file
+    print(f"Total invalid ID count: {total_fine}")
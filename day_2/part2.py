@@ -1,5 +1,7 @@
 from time import perf_counter
 
+from repetition import REPEAT_MULTIPLIERS, digit_segments
+
 # Read input from file
 file = open("day_2/input.txt", "r")
 
@@ -12,15 +14,14 @@ start_time = perf_counter()
 for id_range in line.split(","):
     assert "-" in id_range
     start, end = map(int, id_range.split("-"))
-    for number in range(start, end + 1):
-        for split_count in range(2, len(str(number)) + 1):
-            if len(str(number)) % split_count != 0:
-                continue
-            segment_length = len(str(number)) // split_count
-            segments = [str(number)[i*segment_length:(i+1)*segment_length] for i in range(split_count)]
-            if all(segment == segments[0] for segment in segments[1:]):
-                total_invalid += number
-                break
+    # Split the range by digit count so the repetition multipliers are fixed per segment
+    for length, segment_start, segment_end in digit_segments(start, end):
+        multipliers = REPEAT_MULTIPLIERS[length]
+        for number in range(segment_start, segment_end + 1):
+            for multiplier in multipliers:
+                if number % multiplier == 0:
+                    total_invalid += number
+                    break
 
 end_time = perf_counter()
 print(f"Execution time: {end_time - start_time:.6f} seconds")
@@ -0,0 +1,47 @@
+from collections.abc import Iterator
+
+from enumerated import repeat_multiplier
+
+# Integer-only repetition check for the range scanning scripts.
+#
+# An L-digit number is a k-digit block repeated L / k times exactly when it is divisible
+# by repeat_multiplier(k, L / k) (e.g. 1212 = 12 * 101, 123123 = 123 * 1001). So once we
+# know the digit count, "is this number invalid" is one or a few modulo operations
+# against a table of multipliers, without str(number), slices or segment lists.
+#
+# The digit count comes from splitting each range at the powers of ten, so it is
+# worked out once per range segment rather than once per number. The tables grow on
+# demand, so IDs of any length work (Python ints are unbounded).
+
+POWERS_OF_TEN: list[int] = [1]
+
+# Part 1: block repeated exactly twice, only possible for an even number of digits
+HALF_MULTIPLIERS: list[int | None] = [None]
+
+# Part 2: block repeated any number of times, one multiplier per proper block length
+# (longest blocks first, as they catch the most numbers)
+REPEAT_MULTIPLIERS: list[tuple[int, ...]] = [()]
+
+
+def ensure_digits(length: int) -> None:
+    """Extend the tables in place (so imported names see it) to cover length-digit numbers"""
+    for n in range(len(POWERS_OF_TEN), length + 2):
+        POWERS_OF_TEN.append(10 ** n)
+    for n in range(len(HALF_MULTIPLIERS), length + 1):
+        HALF_MULTIPLIERS.append(repeat_multiplier(n // 2, 2) if n % 2 == 0 else None)
+        REPEAT_MULTIPLIERS.append(tuple(
+            repeat_multiplier(block_length, n // block_length)
+            for block_length in range(n - 1, 0, -1)
+            if n % block_length == 0
+        ))
+
+
+def digit_segments(start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Split [start, end] at the powers of ten, yielding (digit count, segment start, segment end)"""
+    length = len(str(start))
+    ensure_digits(len(str(end)))
+    while start <= end:
+        segment_end = min(end, POWERS_OF_TEN[length] - 1)
+        yield length, start, segment_end
+        start = segment_end + 1
+        length += 1
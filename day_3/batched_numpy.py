@@ -0,0 +1,81 @@
+from time import perf_counter
+
+import numpy as np
+
+# Batched NumPy evaluator for files with lots of equal-length banks
+#
+# All banks are loaded as one 2D digit matrix (one row per bank), and the greedy
+# selection runs on every row at once: the j-th digit of the answer is the leftmost
+# maximum within columns [previous pick + 1, len - n + j] (any further right and there
+# wouldn't be enough digits left to fill the remaining positions). Each of the n steps
+# is a masked argmax over the rows, so the interpreter only loops n times per block.
+#
+# Rows are processed in blocks of BLOCK_ROWS to keep the masked copies small. Each
+# n-digit value fits in an int64 for n <= 18; a block is summed as its high and low
+# 9 digits separately (both far below 2^63), and the block totals are added up as
+# Python ints, so the result is exact however many banks there are.
+
+BLOCK_ROWS: int = 1 << 16
+MAX_POSITIONS: int = 18  # 10^18 - 1 still fits in an int64
+SPLIT: int = 10 ** 9
+
+
+def load_banks(data: bytes) -> np.ndarray:
+    """Parse equal-length banks into a (rows, length) int8 digit matrix"""
+    lines = data.split()
+    if not lines:
+        return np.zeros((0, 0), dtype=np.int8)
+    length = len(lines[0])
+    if any(len(line) != length for line in lines):
+        raise ValueError("All banks must have the same length for the batched evaluator")
+    digits = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), length)
+    return (digits - ord("0")).astype(np.int8)
+
+
+def max_joltages(digits: np.ndarray, n: int) -> np.ndarray:
+    """Largest n-digit selection of every row, as an int64 array"""
+    rows, length = digits.shape
+    if n > MAX_POSITIONS:
+        raise ValueError(f"n must be at most {MAX_POSITIONS} to fit in an int64")
+    if n > length:
+        raise ValueError(f"Banks have fewer than {n} digits")
+
+    row_index = np.arange(rows)
+    columns = np.arange(length)
+    values = np.zeros(rows, dtype=np.int64)
+    lowest = np.zeros(rows, dtype=np.int64)  # First column each row may pick from
+
+    for j in range(n):
+        highest = length - n + j
+        window = digits[:, :highest + 1]
+        masked = np.where(columns[:highest + 1] >= lowest[:, None], window, -1)
+        picks = np.argmax(masked, axis=1)  # argmax returns the leftmost maximum
+        values = values * 10 + masked[row_index, picks]
+        lowest = picks + 1
+
+    return values
+
+
+def total_joltage(digits: np.ndarray, n: int) -> int:
+    total = 0
+    for start in range(0, digits.shape[0], BLOCK_ROWS):
+        values = max_joltages(digits[start:start + BLOCK_ROWS], n)
+        # Sum the high and low 9 digits separately so the int64 sums can't overflow
+        high, low = np.divmod(values, SPLIT)
+        total += int(high.sum()) * SPLIT + int(low.sum())
+    return total
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "rb") as file:
+        digits = load_banks(file.read())
+
+    start_time = perf_counter()
+    total_joltage_part1 = total_joltage(digits, 2)
+    total_joltage_part2 = total_joltage(digits, 12)
+    end_time = perf_counter()
+
+    print(f"NumPy Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Total joltage: {total_joltage_part1}")
+    print(f"Total joltage with 12 positions: {total_joltage_part2}")
@@ -0,0 +1,46 @@
+from time import perf_counter
+
+# Greedy monotonic-stack selector // one function for any number of positions n
+#
+# part2.py slides an n-wide window along the bank and rebuilds a candidates list for
+# every position, which is O(len * n) with a lot of int() calls. The best n-digit
+# selection is the lexicographically largest subsequence of length n, which a stack
+# finds in a single pass:
+#   - we may drop at most len(bank) - n digits in total
+#   - for each digit, pop smaller digits off the top of the stack while we can still
+#     afford to drop them (a bigger digit earlier always beats anything after it)
+#   - push the digit
+# The first n digits left on the stack are the answer. Every digit is pushed and popped
+# at most once, so this is O(len) per bank.
+#
+# We work on the raw bytes: comparing ASCII digit bytes orders them the same way as
+# the digits, so the only int() call is on the n selected bytes at the end.
+
+
+def max_joltage(bank: bytes, n: int) -> int:
+    """Largest number formed by n digits of bank, keeping their order"""
+    drops = len(bank) - n
+    if drops < 0:
+        raise ValueError(f"Bank '{bank.decode()}' has fewer than {n} digits")
+    stack = bytearray()
+    for digit in bank:
+        while drops and stack and stack[-1] < digit:
+            stack.pop()
+            drops -= 1
+        stack.append(digit)
+    return int(stack[:n])
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "rb") as file:
+        banks = [line.rstrip() for line in file if line.strip()]
+
+    start_time = perf_counter()
+    total_joltage_part1 = sum(max_joltage(bank, 2) for bank in banks)
+    total_joltage_part2 = sum(max_joltage(bank, 12) for bank in banks)
+    end_time = perf_counter()
+
+    print(f"Monotonic stack Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Total joltage: {total_joltage_part1}")
+    print(f"Total joltage with 12 positions: {total_joltage_part2}")
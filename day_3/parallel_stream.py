@@ -0,0 +1,68 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Iterator
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import AsyncResult
+from time import perf_counter
+import argparse
+
+from monotonic import max_joltage
+
+# Streaming parallel aggregator // every bank is independent, so the file is read in
+# large blocks (cut at the last newline, the partial bank is carried over to the next
+# block) and each block is sent to a worker, which returns its partial total_joltage.
+# The parent just adds the partials up.
+#
+# Pool.imap would read ahead through the whole file as fast as it can, so instead we
+# submit blocks with apply_async and never keep more than MAX_IN_FLIGHT_PER_WORKER
+# blocks per worker pending. Memory stays around block size * workers.
+
+BLOCK_SIZE: int = 4 << 20  # 4 MiB of banks per task
+MAX_IN_FLIGHT_PER_WORKER: int = 2
+
+
+def iter_blocks(path: str, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield chunks of the file that each end on a newline"""
+    with open(path, "rb") as file:
+        remainder = b""
+        while True:
+            data = file.read(block_size)
+            if not data:
+                break
+            data = remainder + data
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                remainder = data  # Bank longer than a block, keep reading
+                continue
+            remainder = data[cut:]
+            yield data[:cut]
+        if remainder.strip():
+            yield remainder
+
+
+def process_block(block: bytes, n: int) -> int:
+    return sum(max_joltage(bank, n) for bank in block.split())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 3 joltage using a process pool")
+    parser.add_argument("-n", type=int, default=12, help="Number of digits to pick per bank")
+    parser.add_argument("--workers", type=int, default=cpu_count(), help="Number of worker processes")
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE, help="Bytes of input per task")
+    args = parser.parse_args()
+
+    start_time = perf_counter()
+
+    total_joltage = 0
+    pending: deque[AsyncResult] = deque()
+    with Pool(args.workers) as pool:
+        for block in iter_blocks("./input.txt", args.block_size):
+            if len(pending) >= args.workers * MAX_IN_FLIGHT_PER_WORKER:
+                total_joltage += pending.popleft().get()
+            pending.append(pool.apply_async(process_block, (block, args.n)))
+        while pending:
+            total_joltage += pending.popleft().get()
+
+    end_time = perf_counter()
+    print(f"Parallel Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Total joltage with {args.n} positions: {total_joltage}")
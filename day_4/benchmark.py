@@ -36,6 +36,10 @@ def run_benchmark(name: str, script: str, benchmark_type: str, iterations: int =
             # "Iterative Execution time: 0.123456 seconds"
             # "Two-Pass Queue Execution time: 0.123456 seconds"
             # "ByteGrid Execution time: 0.123456 seconds"
+            # "NumPy Execution time: 0.123456 seconds"
+            # "Tiled Execution time: 0.123456 seconds"
+            # "Bit-Sliced Execution time: 0.123456 seconds"
+            # "Parallel Execution time: 0.123456 seconds"
             match = re.search(r"Execution time: (\d+\.\d+) seconds", result.stdout)
             if match:
                 value = float(match.group(1))
@@ -73,7 +77,11 @@ print("=" * 70)
 benchmarks = [
     ("Original (Iterative)", "part2.py"),
     ("Two-Pass Queue", "part2_optimised.py"),
-    ("Two-Pass + ByteGrid", "part2_bytegrid.py")
+    ("Two-Pass + ByteGrid", "part2_bytegrid.py"),
+    ("NumPy Peel Rounds", "part2_numpy.py"),
+    ("Tiled Out-of-Core", "part2_tiled.py"),
+    ("Bit-Sliced Rows", "part2_bitsliced.py"),
+    ("Parallel Stripes", "part2_parallel.py")
 ]
 
 raw_results: list[tuple[str, float, str]] = []
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+
+# Scaling benchmark // time and memory in one run, on generated grids of growing size
+#
+# benchmark.py has to be run twice (BENCHMARK=TIME and BENCHMARK=MEMORY) because
+# tracemalloc distorts timing, and it only knows the one input.txt. Here every
+# implementation runs in a child process that times the script itself and then reads
+# its own peak RSS from resource.getrusage, so one run gives both numbers without any
+# tracing overhead. The grids are generated (seeded) at each requested size and
+# density, which shows where the O(n^2 * k) iterative version falls behind the O(n)
+# queue versions. Results are printed as a table and can be written as JSON.
+
+DAY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Same implementations as benchmark.py
+# Tuples of (Display Name, Script Path)
+benchmarks = [
+    ("Original (Iterative)", "part2.py"),
+    ("Two-Pass Queue", "part2_optimised.py"),
+    ("Two-Pass + ByteGrid", "part2_bytegrid.py"),
+    ("NumPy Peel Rounds", "part2_numpy.py"),
+    ("Tiled Out-of-Core", "part2_tiled.py"),
+    ("Bit-Sliced Rows", "part2_bitsliced.py"),
+    ("Parallel Stripes", "part2_parallel.py"),
+]
+
+# Runs inside the child: time the script, then report peak RSS of this process and of
+# any worker processes it started (ru_maxrss is KB on Linux, bytes on macOS)
+MEASURE_CODE = """
+import json, resource, runpy, sys
+from time import perf_counter
+start = perf_counter()
+runpy.run_path(sys.argv[1], run_name="__main__")
+wall_time = perf_counter() - start
+scale = 1 if sys.platform == "darwin" else 1024
+print("MEASUREMENT " + json.dumps({
+    "wall_time": wall_time,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1024 / 1024,
+    "children_peak_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale / 1024 / 1024,
+}))
+"""
+
+def generate_grid(size: int, density: float, seed: int) -> str:
+    """Square grid of '@' (with probability density) and '.' cells"""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join('@' if rng.random() < density else '.' for _ in range(size))
+        for _ in range(size)
+    ) + "\n"
+
+def measure(script: str, work_dir: str) -> dict | None:
+    """Run one script against work_dir/input.txt, returning its measurements and result"""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE, os.path.join(DAY_DIR, script)],
+        cwd=work_dir,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "BENCHMARK": "TIME"},
+    )
+    if result.returncode != 0:
+        print(f"  Error running {script}: {result.stderr}")
+        return None
+
+    measurement_match = re.search(r"^MEASUREMENT (.*)$", result.stdout, re.MULTILINE)
+    if not measurement_match:
+        print(f"  Could not parse measurements for {script}")
+        return None
+    record = json.loads(measurement_match.group(1))
+
+    # The script's own timing (excludes interpreter start-up and reading the input)
+    time_match = re.search(r"Execution time: (\d+\.\d+) seconds", result.stdout)
+    record["script_time"] = float(time_match.group(1)) if time_match else None
+
+    result_match = re.search(r"Total '@' characters.*: (\d+)", result.stdout)
+    record["result"] = int(result_match.group(1)) if result_match else None
+    return record
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and memory scaling of the day 4 implementations")
+    parser.add_argument("--sizes", default="50,100,200,400", help="Comma separated grid sizes (n for an n x n grid)")
+    parser.add_argument("--density", type=float, default=0.6, help="Probability of a cell holding paper")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated grids")
+    parser.add_argument("--iterations", type=int, default=3, help="Runs per implementation and size (best is kept)")
+    parser.add_argument("--only", help="Comma separated script names to run (e.g. 'part2.py,part2_optimised.py')")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    only = args.only.split(",") if args.only else None
+    records: list[dict] = []
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in [int(size) for size in args.sizes.split(",")]:
+            with open(os.path.join(work_dir, "input.txt"), "w") as file:
+                file.write(generate_grid(size, args.density, args.seed))
+
+            print("=" * 70)
+            print(f"Grid {size}x{size} (density {args.density})")
+            print("=" * 70)
+            results_set: set[int | None] = set()
+
+            for name, script in benchmarks:
+                if only and script not in only:
+                    continue
+                runs = [run for run in (measure(script, work_dir) for _ in range(args.iterations)) if run]
+                if not runs:
+                    continue
+                best = min(runs, key=lambda run: run["wall_time"])
+                record = {
+                    "implementation": name, "script": script, "size": size,
+                    "density": args.density, "seed": args.seed, **best,
+                }
+                records.append(record)
+                results_set.add(record["result"])
+                print(
+                    f"| {name:<25} | {record['wall_time']:<10.6f} s "
+                    f"| {record['peak_rss_mb']:<8.2f} MB (+{record['children_peak_rss_mb']:.2f} MB workers) "
+                    f"| {record['result']}"
+                )
+
+            if len(results_set) > 1:
+                print(f"✗ WARNING: Different results detected for size {size}!")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(records, file, indent=2)
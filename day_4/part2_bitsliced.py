@@ -0,0 +1,109 @@
+from typing import Literal
+from time import perf_counter
+import tracemalloc
+import os
+
+# Bit-parallel row bitmaps
+#
+# The bytegrid version still looks at every cell and direction one at a time. Here each
+# row is a single Python int with bit c set if column c has paper, so one bitwise
+# operation handles a whole row at once.
+#
+# For row r, the 8 neighbour masks are the rows above and below (unshifted), and the
+# rows above, at and below shifted one column left and right. Bit c of each mask says
+# whether that neighbour of cell c has paper. Adding the 8 masks up bit-wise with
+# full adders (carry-save style) gives the neighbour count of every cell in the row as
+# bit-slices, and "fewer than 4 neighbours" is just "the 4s and 8s bits are both 0".
+#
+# Removal then runs in rounds until nothing changes. Removing a paper only ever lowers
+# neighbour counts, so this reaches the same fixed point as the queue cascade. Only rows
+# next to a row that changed in the last round need to be looked at again.
+
+# Read benchmark type from environment
+BENCHMARK_TYPE: Literal["MEMORY", "TIME"] = os.environ.get("BENCHMARK", "TIME")  # type: ignore
+
+if BENCHMARK_TYPE == "MEMORY":
+    tracemalloc.start()
+
+NEIGHBOUR_THRESHOLD: Literal[4] = 4
+
+def full_adder(a: int, b: int, c: int) -> tuple[int, int]:
+    """Bit-wise a + b + c, returned as (sum bits, carry bits)"""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+def at_least_four(n0: int, n1: int, n2: int, n3: int, n4: int, n5: int, n6: int, n7: int) -> int:
+    """Bits set where at least 4 of the 8 neighbour masks are set"""
+    # First layer: three groups of inputs, each giving a 1s bit and a 2s bit
+    s0, c0 = full_adder(n0, n1, n2)
+    s1, c1 = full_adder(n3, n4, n5)
+    s2, c2 = full_adder(n6, n7, 0)
+    # Adding the 1s bits gives one more 2s bit (the 1s result doesn't matter for >= 4)
+    _, c3 = full_adder(s0, s1, s2)
+    # count >= 4  <=>  the four 2s bits add up to at least 2
+    t, u = full_adder(c0, c1, c2)
+    return u | (t & c3)
+
+# Read input from file
+file = open("./input.txt", "r")
+
+# Start timing BEFORE processing (includes building the row bitmaps)
+if BENCHMARK_TYPE == "TIME":
+    start_time = perf_counter()
+
+# Pass 1: One int per row, bit c set for paper in column c
+rows: list[int] = []
+width = 0
+for line in file:
+    line = line.rstrip()
+    if not line:
+        continue
+    width = len(line)
+    # Reverse so column 0 ends up in bit 0
+    rows.append(int(line[::-1].replace('@', '1').replace('.', '0'), 2))
+file.close()
+
+height = len(rows)
+full_mask = (1 << width) - 1
+
+# Pad with empty rows above and below, so rows[r + 1] is grid row r
+rows = [0] + rows + [0]
+
+# Removal rounds until a fixed point
+removed_total = 0
+dirty = set(range(1, height + 1))  # Rows that may contain removable papers
+
+while dirty:
+    removals: list[tuple[int, int]] = []
+    for r in dirty:
+        row = rows[r]
+        if not row:
+            continue
+        above, below = rows[r - 1], rows[r + 1]
+        crowded = at_least_four(
+            above, below,
+            (above << 1) & full_mask, (row << 1) & full_mask, (below << 1) & full_mask,
+            above >> 1, row >> 1, below >> 1,
+        )
+        removable = row & ~crowded
+        if removable:
+            removals.append((r, removable))
+
+    # Apply all removals of this round at once
+    dirty = set()
+    for r, removable in removals:
+        rows[r] &= ~removable
+        removed_total += removable.bit_count()
+        for nr in (r - 1, r, r + 1):
+            if 1 <= nr <= height:
+                dirty.add(nr)
+
+if BENCHMARK_TYPE == "TIME":
+    end_time = perf_counter()
+    print(f"Bit-Sliced Execution time: {end_time - start_time:.6f} seconds") # type: ignore
+elif BENCHMARK_TYPE == "MEMORY":
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Peak memory usage: {peak / 1024 / 1024:.2f} MB")
+
+print(f"Total '@' characters with fewer than {NEIGHBOUR_THRESHOLD} adjacent '@' (bit-sliced): {removed_total}")
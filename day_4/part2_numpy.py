@@ -0,0 +1,94 @@
+from typing import Literal
+from time import perf_counter
+import tracemalloc
+import os
+
+import numpy as np
+
+# NumPy "peel rounds" approach
+#
+# The two-pass versions still compute the initial neighbour counts with a Python double
+# loop over every cell and direction. Here the grid is a padded boolean array and the
+# counts for every cell come from summing the 8 shifted views of it (a 3x3 box sum
+# minus the centre), which runs entirely inside NumPy.
+#
+# The cascade then runs in rounds: every paper with fewer than 4 neighbours is removed
+# at once, and the counts are recomputed. Removing a paper only ever lowers neighbour
+# counts, so removing in rounds ends at the same fixed point as the queue cascade.
+# Only cells next to a removed paper can change, so each round only recomputes the
+# counts inside the bounding box of the removed papers (grown by one cell), which
+# shrinks quickly as the cascade dies down.
+
+# Read benchmark type from environment
+BENCHMARK_TYPE: Literal["MEMORY", "TIME"] = os.environ.get("BENCHMARK", "TIME")  # type: ignore
+
+if BENCHMARK_TYPE == "MEMORY":
+    tracemalloc.start()
+
+NEIGHBOUR_THRESHOLD: Literal[4] = 4
+
+# The 8 neighbour offsets
+directions = [(-1, -1), (-1, 0), (-1, 1),
+              ( 0, -1),          ( 0, 1),
+              ( 1, -1), ( 1, 0), ( 1, 1)]
+
+def neighbour_counts(padded: np.ndarray, r0: int, r1: int, c0: int, c1: int) -> np.ndarray:
+    """
+    Neighbour counts for grid rows r0..r1-1 and columns c0..c1-1.
+
+    padded has a one-cell border of empty cells, so grid cell (r, c) is padded[r + 1, c + 1]
+    and every shifted slice stays in bounds.
+    """
+    counts = np.zeros((r1 - r0, c1 - c0), dtype=np.uint8)
+    for dr, dc in directions:
+        counts += padded[r0 + 1 + dr:r1 + 1 + dr, c0 + 1 + dc:c1 + 1 + dc]
+    return counts
+
+# Read input from file
+file = open("./input.txt", "rb")
+data = file.read()
+file.close()
+
+# Start timing/memory AFTER file read, BEFORE processing
+if BENCHMARK_TYPE == "TIME":
+    start_time = perf_counter()
+
+lines = data.split()
+H, W = len(lines), len(lines[0]) if lines else 0
+
+# Pass 1: Boolean grid with an empty border
+padded = np.zeros((H + 2, W + 2), dtype=bool)
+padded[1:-1, 1:-1] = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(H, W) == ord("@")
+
+# Pass 2: Neighbour counts for the whole grid in one go
+counts = neighbour_counts(padded, 0, H, 0, W)
+
+# Peel rounds, restricted to the dirty region
+removed_total = 0
+r0, r1, c0, c1 = 0, H, 0, W  # Region that may contain removable papers
+
+while r0 < r1 and c0 < c1:
+    grid_view = padded[r0 + 1:r1 + 1, c0 + 1:c1 + 1]
+    removable = grid_view & (counts[r0:r1, c0:c1] < NEIGHBOUR_THRESHOLD)
+    rows = np.flatnonzero(removable.any(axis=1))
+    if len(rows) == 0:
+        break
+    cols = np.flatnonzero(removable.any(axis=0))
+
+    grid_view[removable] = False
+    removed_total += int(np.count_nonzero(removable))
+
+    # Only cells within one of a removed paper have a new count
+    r0, r1 = max(0, r0 + rows[0] - 1), min(H, r0 + rows[-1] + 2)
+    c0, c1 = max(0, c0 + cols[0] - 1), min(W, c0 + cols[-1] + 2)
+    counts[r0:r1, c0:c1] = neighbour_counts(padded, r0, r1, c0, c1)
+
+if BENCHMARK_TYPE == "TIME":
+    end_time = perf_counter()
+    print(f"NumPy Execution time: {end_time - start_time:.6f} seconds") # type: ignore
+elif BENCHMARK_TYPE == "MEMORY":
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Peak memory usage: {peak / 1024 / 1024:.2f} MB")
+
+print(f"Total '@' characters with fewer than {NEIGHBOUR_THRESHOLD} adjacent '@' (numpy): {removed_total}")
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from typing import Literal
+from time import perf_counter
+from multiprocessing import Pool, cpu_count, shared_memory
+import tracemalloc
+import os
+
+# Simple queue implementation to avoid external dep
+class Queue:
+    """Simple FIFO queue implementation for BFS traversal"""
+    def __init__(self):
+        self.items: list[int] = []
+        self.front_index: int = 0
+
+    def append(self, item: int) -> None:
+        self.items.append(item)
+
+    def popleft(self) -> int:
+        if self.is_empty():
+            raise IndexError("pop from empty queue")
+        item = self.items[self.front_index]
+        self.front_index += 1
+        # Periodically clean up consumed items to prevent memory bloat
+        if self.front_index > 1000:
+            self.items = self.items[self.front_index:]
+            self.front_index = 0
+        return item
+
+    def is_empty(self) -> bool:
+        return self.front_index >= len(self.items)
+
+# Multi-process stripe-partitioned cascade
+#
+# The grid lives in a multiprocessing.shared_memory block with the same byte layout as
+# part2_bytegrid.py (bit 7 = paper, bits 0-3 = neighbour count), so no worker ever gets
+# a copy of the full grid. It is split into horizontal stripes, one per worker, and
+# each worker only ever *writes* to the cells of its own stripe.
+#
+# The cascade runs in synchronised rounds:
+#   - First each worker counts the neighbours of its own cells. This is a round of its
+#     own, so nobody reads across a stripe boundary while another worker is removing
+#   - Round 1: each worker queues its removable cells and runs the queue cascade
+#     within its stripe
+#   - A removal in a stripe's first or last row also lowers the counts of cells in the
+#     neighbouring stripe, which the owner of that stripe has to apply. Workers return
+#     those boundary removals, and the parent hands them to the neighbouring stripe in
+#     the next round, which decrements its counts and continues its cascade
+#   - We stop once a round produces no boundary removals (no worker has pending work)
+# Removing a paper only ever lowers neighbour counts, so the order of removals doesn't
+# change the result and it matches the single-process versions.
+
+# Constants for bit manipulation (same layout as part2_bytegrid.py)
+PAPER_BIT: int = 0b10000000  # Bit 7: Paper present flag (128)
+COUNT_MASK: int = 0b00001111  # Bits 0-3: Neighbor count mask (15)
+
+NEIGHBOUR_THRESHOLD: Literal[4] = 4
+
+directions = [(-1, -1), (-1, 0), (-1, 1),
+              ( 0, -1),          ( 0, 1),
+              ( 1, -1), ( 1, 0), ( 1, 1)]
+
+def count_stripe(task: tuple[str, int, int, int, int]) -> None:
+    """Store the neighbour counts of the cells in rows r0..r1-1"""
+    shm_name, height, width, r0, r1 = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    grid = shm.buf
+
+    for r in range(r0, r1):
+        for c in range(width):
+            idx = r * width + c
+            if grid[idx] & PAPER_BIT:
+                count = 0
+                for dr, dc in directions:
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < height and 0 <= nc < width:
+                        if grid[nr * width + nc] & PAPER_BIT:
+                            count += 1
+                grid[idx] |= count
+
+    del grid  # Release the view before closing
+    shm.close()
+
+def run_stripe(task: tuple[str, int, int, int, int, list[int] | None]) -> tuple[int, list[int], list[int]]:
+    """
+    Run one round of the cascade on rows r0..r1-1.
+
+    incoming is None for the first round (queue every removable cell in the stripe),
+    otherwise the indices of cells removed by neighbouring stripes next to this one.
+    Returns (papers removed, removals in the first row, removals in the last row).
+    """
+    shm_name, height, width, r0, r1, incoming = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    grid = shm.buf
+    queue = Queue()
+
+    if incoming is None:
+        for idx in range(r0 * width, r1 * width):
+            if grid[idx] & PAPER_BIT and grid[idx] & COUNT_MASK < NEIGHBOUR_THRESHOLD:
+                queue.append(idx)
+    else:
+        # Apply the neighbouring stripes' boundary removals to our cells
+        for removed_idx in incoming:
+            r, c = divmod(removed_idx, width)
+            for dr, dc in directions:
+                nr, nc = r + dr, c + dc
+                if r0 <= nr < r1 and 0 <= nc < width:
+                    n_idx = nr * width + nc
+                    if grid[n_idx] & PAPER_BIT:
+                        grid[n_idx] -= 1
+                        if grid[n_idx] & COUNT_MASK == NEIGHBOUR_THRESHOLD - 1:
+                            queue.append(n_idx)
+
+    # BFS within the stripe
+    removed_count = 0
+    top_removals: list[int] = []
+    bottom_removals: list[int] = []
+
+    while not queue.is_empty():
+        curr_idx = queue.popleft()
+        if not (grid[curr_idx] & PAPER_BIT):
+            continue
+        grid[curr_idx] &= ~PAPER_BIT & 0xFF
+        removed_count += 1
+
+        r, c = divmod(curr_idx, width)
+        if r == r0:
+            top_removals.append(curr_idx)
+        if r == r1 - 1:
+            bottom_removals.append(curr_idx)
+
+        for dr, dc in directions:
+            nr, nc = r + dr, c + dc
+            if r0 <= nr < r1 and 0 <= nc < width:  # Other stripes are updated by their owner
+                n_idx = nr * width + nc
+                if grid[n_idx] & PAPER_BIT:
+                    grid[n_idx] -= 1
+                    if grid[n_idx] & COUNT_MASK == NEIGHBOUR_THRESHOLD - 1:
+                        queue.append(n_idx)
+
+    del grid  # Release the view before closing
+    shm.close()
+    return removed_count, top_removals, bottom_removals
+
+if __name__ == "__main__":
+    # Read benchmark type from environment
+    BENCHMARK_TYPE: Literal["MEMORY", "TIME"] = os.environ.get("BENCHMARK", "TIME")  # type: ignore
+
+    if BENCHMARK_TYPE == "MEMORY":
+        tracemalloc.start()
+
+    # Read input from file
+    file = open("./input.txt", "rb")
+    lines = [line.rstrip() for line in file if line.strip()]
+    file.close()
+
+    if BENCHMARK_TYPE == "TIME":
+        start_time = perf_counter()
+
+    height, width = len(lines), len(lines[0]) if lines else 0
+
+    # Pass 1: Fill the shared bytegrid, '@' -> PAPER_BIT, anything else -> 0
+    to_bytegrid = bytes(PAPER_BIT if i == ord('@') else 0 for i in range(256))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, height * width))
+    shm.buf[:height * width] = b"".join(lines).translate(to_bytegrid)
+    del lines
+
+    # One stripe per worker (WORKERS environment variable overrides the CPU count)
+    num_workers = max(1, min(int(os.environ.get("WORKERS", cpu_count())), height))
+    bounds = [height * i // num_workers for i in range(num_workers + 1)]
+    stripes = [(bounds[i], bounds[i + 1]) for i in range(num_workers) if bounds[i] < bounds[i + 1]]
+
+    removed_total = 0
+    try:
+        with Pool(max(1, len(stripes))) as pool:
+            pool.map(count_stripe, [(shm.name, height, width, r0, r1) for r0, r1 in stripes])
+
+            incoming: list[list[int] | None] = [None] * len(stripes)
+            while True:
+                tasks = [(shm.name, height, width, r0, r1, incoming[i]) for i, (r0, r1) in enumerate(stripes)]
+                results = pool.map(run_stripe, tasks)
+
+                # Route boundary removals to the neighbouring stripes for the next round
+                incoming = [[] for _ in stripes]
+                for i, (removed_count, top_removals, bottom_removals) in enumerate(results):
+                    removed_total += removed_count
+                    if i > 0:
+                        incoming[i - 1].extend(top_removals)  # type: ignore
+                    if i < len(stripes) - 1:
+                        incoming[i + 1].extend(bottom_removals)  # type: ignore
+                if not any(incoming):
+                    break
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if BENCHMARK_TYPE == "TIME":
+        end_time = perf_counter()
+        print(f"Parallel Execution time: {end_time - start_time:.6f} seconds") # type: ignore
+    elif BENCHMARK_TYPE == "MEMORY":
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Peak memory usage: {peak / 1024 / 1024:.2f} MB")
+
+    print(f"Total '@' characters with fewer than {NEIGHBOUR_THRESHOLD} adjacent '@' (parallel): {removed_total}")
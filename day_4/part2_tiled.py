@@ -0,0 +1,197 @@
+from typing import Literal
+from time import perf_counter
+import tracemalloc
+import mmap
+import os
+import tempfile
+
+# Simple queue implementation to avoid external dep
+class Queue:
+    """Simple FIFO queue implementation for BFS traversal"""
+    def __init__(self):
+        self.items: list[int] = []
+        self.front_index: int = 0
+
+    def append(self, item: int) -> None:
+        self.items.append(item)
+
+    def popleft(self) -> int:
+        if self.is_empty():
+            raise IndexError("pop from empty queue")
+        item = self.items[self.front_index]
+        self.front_index += 1
+        # Periodically clean up consumed items to prevent memory bloat
+        if self.front_index > 1000:
+            self.items = self.items[self.front_index:]
+            self.front_index = 0
+        return item
+
+    def is_empty(self) -> bool:
+        return self.front_index >= len(self.items)
+
+# Out-of-core tiled cascade, for grids that don't fit in memory
+#
+# part2.py avoids loading the grid but rescans the whole file every iteration, and the
+# two-pass versions hold the entire grid in memory. Here input.txt is memory-mapped
+# read-only (the OS pages it in and out as needed), removals are kept in a one bit per
+# cell bitmap file next to it (also memory-mapped, 1/8 the size of the grid), and the
+# cascade runs one TILE_SIZE x TILE_SIZE tile at a time:
+#   - Load the tile plus a one-cell halo (the neighbours just outside it) into a small
+#     bytegrid, skipping removed cells, count neighbours and run the queue cascade from
+#     part2_bytegrid.py on the tile's own cells (halo cells are only counted, never removed)
+#   - Set the removed cells' bits in the bitmap
+#   - A removal on the tile's edge changes the halo of the neighbouring tile(s), so
+#     those tiles go on the frontier queue to be revisited
+# Every tile starts on the frontier, and we stop once it is empty. Removing a paper
+# only ever lowers neighbour counts, so the result is the same fixed point as the
+# global queue cascade. Only one tile is in memory at a time, plus the frontier (one
+# entry per tile), so peak memory is bounded by the tile size rather than the grid.
+
+# Constants for bit manipulation (same layout as part2_bytegrid.py)
+PAPER_BIT: int = 0b10000000  # Bit 7: Paper present flag (128)
+COUNT_MASK: int = 0b00001111  # Bits 0-3: Neighbor count mask (15)
+
+TILE_SIZE: int = 64
+
+# Read benchmark type from environment
+BENCHMARK_TYPE: Literal["MEMORY", "TIME"] = os.environ.get("BENCHMARK", "TIME")  # type: ignore
+
+if BENCHMARK_TYPE == "MEMORY":
+    tracemalloc.start()
+
+NEIGHBOUR_THRESHOLD: Literal[4] = 4
+
+directions = [(-1, -1), (-1, 0), (-1, 1),
+              ( 0, -1),          ( 0, 1),
+              ( 1, -1), ( 1, 0), ( 1, 1)]
+
+def process_tile(
+        grid: mmap.mmap, removed_bits: mmap.mmap, height: int, width: int, stride: int, tile_row: int, tile_col: int
+    ) -> list[tuple[int, int]]:
+    """Run the cascade on one tile, mark removals in the bitmap and return the removed (row, col) cells"""
+    r0, c0 = tile_row * TILE_SIZE, tile_col * TILE_SIZE
+    r1, c1 = min(height, r0 + TILE_SIZE), min(width, c0 + TILE_SIZE)
+
+    # Local bytegrid of the tile plus its halo // cells outside the grid stay empty
+    local_h, local_w = r1 - r0 + 2, c1 - c0 + 2
+    local = bytearray(local_h * local_w)
+    for lr in range(local_h):
+        r = r0 + lr - 1
+        if not 0 <= r < height:
+            continue
+        lc_start = 1 if c0 == 0 else 0
+        c_start = c0 + lc_start - 1
+        c_end = min(width, c1 + 1)
+        row_bytes = grid[r * stride + c_start:r * stride + c_end]
+        # Bitmap bytes covering the same cells, bit i of the grid is bit i % 8 of byte i // 8
+        bit_start = r * width + c_start
+        row_bits = removed_bits[bit_start >> 3:((r * width + c_end) >> 3) + 1]
+        for offset, char in enumerate(row_bytes):
+            if char == ord('@'):
+                bit = (bit_start & 7) + offset
+                if not row_bits[bit >> 3] & (1 << (bit & 7)):
+                    local[lr * local_w + lc_start + offset] = PAPER_BIT
+
+    # Neighbour counts for the tile's own cells, queue the removable ones
+    queue = Queue()
+    for lr in range(1, local_h - 1):
+        for lc in range(1, local_w - 1):
+            idx = lr * local_w + lc
+            if local[idx] & PAPER_BIT:
+                count = 0
+                for dr, dc in directions:
+                    if local[(lr + dr) * local_w + lc + dc] & PAPER_BIT:
+                        count += 1
+                local[idx] |= count
+                if count < NEIGHBOUR_THRESHOLD:
+                    queue.append(idx)
+
+    # Cascade within the tile
+    removed: list[tuple[int, int]] = []
+    while not queue.is_empty():
+        curr_idx = queue.popleft()
+        if not (local[curr_idx] & PAPER_BIT):
+            continue
+        local[curr_idx] &= ~PAPER_BIT
+        lr, lc = divmod(curr_idx, local_w)
+        r, c = r0 + lr - 1, c0 + lc - 1
+        bit = r * width + c
+        removed_bits[bit >> 3] |= 1 << (bit & 7)
+        removed.append((r, c))
+
+        for dr, dc in directions:
+            nr, nc = lr + dr, lc + dc
+            if not (1 <= nr < local_h - 1 and 1 <= nc < local_w - 1):
+                continue  # Halo cell, owned by another tile
+            n_idx = nr * local_w + nc
+            if local[n_idx] & PAPER_BIT:
+                local[n_idx] -= 1
+                if local[n_idx] & COUNT_MASK == NEIGHBOUR_THRESHOLD - 1:
+                    queue.append(n_idx)
+
+    return removed
+
+# Start timing BEFORE mapping the grid, so setting up the bitmap is timed too
+if BENCHMARK_TYPE == "TIME":
+    start_time = perf_counter()
+
+input_path = os.path.abspath("./input.txt")
+file = open(input_path, "rb")
+first_line = file.readline()
+width = len(first_line.rstrip(b"\r\n"))
+# Rows are width bytes plus the line terminator ('\n' or '\r\n'), measured from the first row
+line_ending = first_line[width:] or b"\n"
+stride = width + len(line_ending)
+file_size = os.fstat(file.fileno()).st_size
+file.seek(max(0, file_size - 1))
+if file_size and file.read(1) != b"\n":
+    file_size += len(line_ending)  # Last row has no terminator, count it as a full row
+height = file_size // stride if width else 0
+
+removed_total = 0
+if height:
+    grid = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    # Removal bitmap on the same filesystem as the input (not /tmp, which may be RAM backed)
+    bitmap_file = tempfile.TemporaryFile(dir=os.path.dirname(input_path))
+    bitmap_file.truncate(-(-height * width // 8))
+    removed_bits = mmap.mmap(bitmap_file.fileno(), 0)
+    tile_rows = -(-height // TILE_SIZE)
+    tile_cols = -(-width // TILE_SIZE)
+
+    # Frontier of tiles to (re)visit, with a flag per tile to avoid queueing it twice
+    frontier = Queue()
+    queued = bytearray(b"\x01" * (tile_rows * tile_cols))
+    for tile in range(tile_rows * tile_cols):
+        frontier.append(tile)
+
+    while not frontier.is_empty():
+        tile = frontier.popleft()
+        queued[tile] = 0
+        tile_row, tile_col = divmod(tile, tile_cols)
+        removed = process_tile(grid, removed_bits, height, width, stride, tile_row, tile_col)
+        removed_total += len(removed)
+
+        # Tiles whose halo contains a removed cell need another look
+        for r, c in removed:
+            for dr, dc in directions:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < height and 0 <= nc < width:
+                    neighbour_tile = (nr // TILE_SIZE) * tile_cols + nc // TILE_SIZE
+                    if neighbour_tile != tile and not queued[neighbour_tile]:
+                        queued[neighbour_tile] = 1
+                        frontier.append(neighbour_tile)
+
+    removed_bits.close()
+    bitmap_file.close()
+    grid.close()
+file.close()
+
+if BENCHMARK_TYPE == "TIME":
+    end_time = perf_counter()
+    print(f"Tiled Execution time: {end_time - start_time:.6f} seconds") # type: ignore
+elif BENCHMARK_TYPE == "MEMORY":
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Peak memory usage: {peak / 1024 / 1024:.2f} MB")
+
+print(f"Total '@' characters with fewer than {NEIGHBOUR_THRESHOLD} adjacent '@' (tiled): {removed_total}")
@@ -0,0 +1,173 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from time import perf_counter
+import random
+
+# Dynamic interval set for ranges that change over time
+#
+# SortedRanges is rebuilt from scratch every run and merging is a separate pass. Here
+# the merged ranges live in a skip list keyed on their start (a sorted linked list with
+# "express lanes" on random levels, so searches are O(log n) expected, with no external
+# dependency). Every update keeps the list merged:
+#   - insert(start, end) extends/absorbs any range it overlaps or touches
+#   - remove(start, end) trims, deletes or splits the ranges it overlaps
+# and a running total of covered IDs (the part 2 answer) is adjusted as ranges change,
+# so it never needs recomputing. Each range absorbed by an insert is deleted once, so
+# updates are O(log n) amortised.
+
+MAX_LEVEL: int = 32
+LEVEL_PROBABILITY: float = 0.5
+
+
+class _Node:
+    __slots__ = ("start", "end", "forward")
+
+    def __init__(self, start: int, end: int, level: int):
+        self.start = start
+        self.end = end
+        self.forward: list[_Node | None] = [None] * level
+
+
+class DynamicIntervals:
+    def __init__(self, seed: int | None = None):
+        self.head = _Node(0, 0, MAX_LEVEL)  # Sentinel, never holds a range
+        self.level = 1
+        self.covered = 0  # Total IDs covered by all ranges
+        self.count = 0  # Number of (merged) ranges
+        self._random = random.Random(seed)
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < LEVEL_PROBABILITY:
+            level += 1
+        return level
+
+    def _search_path(self, key: int) -> list[_Node]:
+        """The last node with start < key on every level"""
+        update = [self.head] * MAX_LEVEL
+        node = self.head
+        for i in reversed(range(self.level)):
+            while (next_node := node.forward[i]) is not None and next_node.start < key:
+                node = next_node
+            update[i] = node
+        return update
+
+    def _link(self, start: int, end: int, update: list[_Node]) -> None:
+        """Insert a new range after the nodes in update"""
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+            self.level = level
+        node = _Node(start, end, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+        self.count += 1
+
+    def _unlink_next(self, update: list[_Node]) -> _Node:
+        """Remove the node straight after update[0]"""
+        node = update[0].forward[0]
+        assert node is not None
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.count -= 1
+        return node
+
+    def insert(self, start: int, end: int) -> None:
+        """Add the IDs start..end, merging with any range they overlap or touch"""
+        update = self._search_path(start)
+        previous = update[0]
+
+        if previous is not self.head and previous.end >= start - 1:
+            # Extend the range before us in place
+            target = previous
+            self.covered -= target.end - target.start + 1
+            target.end = max(target.end, end)
+        else:
+            target = None
+            new_end = end
+
+        # Absorb every following range that now overlaps or touches
+        while (next_node := update[0].forward[0]) is not None \
+                and next_node.start <= (target.end if target else new_end) + 1:
+            self._unlink_next(update)
+            self.covered -= next_node.end - next_node.start + 1
+            if target:
+                target.end = max(target.end, next_node.end)
+            else:
+                new_end = max(new_end, next_node.end)
+
+        if target:
+            self.covered += target.end - target.start + 1
+        else:
+            self._link(start, new_end, update)
+            self.covered += new_end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove the IDs start..end, splitting a range if they sit inside it"""
+        update = self._search_path(start)
+        previous = update[0]
+
+        if previous is not self.head and previous.end >= start:
+            if previous.end > end:
+                # Removing from the middle of a range splits it in two
+                old_end = previous.end
+                previous.end = start - 1
+                self.covered -= end - start + 1
+                self._link(end + 1, old_end, self._search_path(end + 1))
+                return
+            self.covered -= previous.end - start + 1
+            previous.end = start - 1
+
+        # Ranges starting inside start..end are deleted, or trimmed if they run past it
+        while (next_node := update[0].forward[0]) is not None and next_node.start <= end:
+            if next_node.end <= end:
+                self._unlink_next(update)
+                self.covered -= next_node.end - next_node.start + 1
+            else:
+                # Still sorted after moving the start: the next range starts after next_node.end
+                self.covered -= end - next_node.start + 1
+                next_node.start = end + 1
+                break
+
+    def __contains__(self, ingredient_id: int) -> bool:
+        node = self.head
+        for i in reversed(range(self.level)):
+            while (next_node := node.forward[i]) is not None and next_node.start <= ingredient_id:
+                node = next_node
+        return node is not self.head and ingredient_id <= node.end
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        node = self.head.forward[0]
+        while node is not None:
+            yield node.start, node.end
+            node = node.forward[0]
+
+
+if __name__ == "__main__":
+    start_time = perf_counter()
+
+    intervals = DynamicIntervals(seed=0)
+    fresh_ingredients = 0
+
+    # Read input from file // ranges are merged as they arrive
+    with open("./input.txt", "r") as file:
+        for line in file:
+            if '-' in line:
+                start, end = map(int, line.rstrip().split("-"))
+                intervals.insert(start, end)
+            elif line.rstrip():
+                if int(line.rstrip()) in intervals:
+                    fresh_ingredients += 1
+
+    end_time = perf_counter()
+
+    print(f"Dynamic intervals check took {end_time - start_time:.6f} seconds ({len(intervals)} merged ranges)")
+    print(f"Number of fresh ingredients: {fresh_ingredients}")
+    print(f"Number of valid fresh ingredients ids: {intervals.covered}")
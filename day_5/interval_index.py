@@ -0,0 +1,88 @@
+from __future__ import annotations
+from bisect import bisect_right
+from time import perf_counter
+
+# Interval index for ingredient ID lookups
+#
+# part1.py merges the ranges but then still checks every ingredient against every merged
+# range (O(n * m)), and SortedRanges.insert uses list.insert, which is O(n^2) overall.
+# Here the ranges are sorted once in bulk and merged into two parallel lists, starts and
+# ends. Since merged ranges don't overlap, an ID is fresh exactly when the last range
+# starting at or before it also ends at or after it, which one binary search finds.
+#
+# For large batches of IDs there is also a sweep: sort the IDs once, then walk them and
+# the ranges together in a single merge pass, never moving backwards through either.
+
+
+class IntervalIndex:
+    def __init__(self, ranges: list[tuple[int, int]]):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for start, end in sorted(ranges):
+            if self.ends and start <= self.ends[-1] + 1:  # Overlapping or contiguous ranges
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, ingredient_id: int) -> bool:
+        # Index of the last range starting at or before ingredient_id
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def count_fresh(self, ingredient_ids: list[int]) -> int:
+        """Number of IDs inside any range, using a binary search per ID"""
+        return sum(1 for ingredient_id in ingredient_ids if ingredient_id in self)
+
+    def count_fresh_sweep(self, ingredient_ids: list[int]) -> int:
+        """Number of IDs inside any range, sorting the IDs and sweeping them against the ranges"""
+        fresh = 0
+        i = 0
+        for ingredient_id in sorted(ingredient_ids):
+            # Skip ranges that end before this ID (and therefore before every later ID)
+            while i < len(self.ends) and self.ends[i] < ingredient_id:
+                i += 1
+            if i == len(self.ends):
+                break
+            if self.starts[i] <= ingredient_id:
+                fresh += 1
+        return fresh
+
+    def total_covered(self) -> int:
+        """Number of IDs covered by the ranges (the part 2 answer)"""
+        return sum(end - start + 1 for start, end in zip(self.starts, self.ends))
+
+
+if __name__ == "__main__":
+    # Read input from file
+    ranges: list[tuple[int, int]] = []
+    ingredient_ids: list[int] = []
+    with open("./input.txt", "r") as file:
+        for line in file:
+            if '-' in line:
+                start, end = map(int, line.rstrip().split("-"))
+                ranges.append((start, end))
+            elif line.rstrip():
+                ingredient_ids.append(int(line.rstrip()))
+
+    start_time_index = perf_counter()
+    index = IntervalIndex(ranges)
+    end_time_index = perf_counter()
+
+    start_time_bisect = perf_counter()
+    fresh_ingredients_bisect = index.count_fresh(ingredient_ids)
+    end_time_bisect = perf_counter()
+
+    start_time_sweep = perf_counter()
+    fresh_ingredients_sweep = index.count_fresh_sweep(ingredient_ids)
+    end_time_sweep = perf_counter()
+
+    print(f"Building the index took {end_time_index - start_time_index:.6f} seconds ({len(index)} merged ranges)")
+    print(f"Bisect lookups took {end_time_bisect - start_time_bisect:.6f} seconds")
+    print(f"Sorted sweep took {end_time_sweep - start_time_sweep:.6f} seconds")
+    print(f"Number of fresh ingredients (bisect): {fresh_ingredients_bisect}")
+    print(f"Number of fresh ingredients (sweep): {fresh_ingredients_sweep}")
+    print(f"Number of valid fresh ingredients ids: {index.total_covered()}")
@@ -0,0 +1,61 @@
+from time import perf_counter
+
+import numpy as np
+
+# Vectorised version of interval_index.py for tens of millions of ingredient IDs
+#
+# The ranges and IDs are parsed straight into int64 arrays. Merging is a sort by start
+# followed by a running maximum of the ends (np.maximum.accumulate): a new merged range
+# begins wherever a start is past the running end + 1 of everything before it.
+# Classifying the IDs is then a single np.searchsorted (index of the last merged range
+# starting at or before each ID) and one comparison against that range's end.
+# Part 2's coverage is one vectorised sum over the merged arrays.
+
+
+def parse_input(text: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse the ranges (as starts and ends) and the ingredient IDs into int64 arrays"""
+    range_text, _, id_text = text.strip().partition("\n\n")
+    bounds = np.fromstring(range_text.replace("-", " "), dtype=np.int64, sep=" ").reshape(-1, 2)
+    ingredient_ids = np.fromstring(id_text, dtype=np.int64, sep=" ")
+    return bounds[:, 0], bounds[:, 1], ingredient_ids
+
+
+def merge_ranges(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge overlapping or contiguous ranges, returning sorted, disjoint starts and ends"""
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+
+    running_end = np.maximum.accumulate(ends)
+    # A range starts a new merged range if it begins after everything before it ends (+1)
+    is_new = np.empty(len(starts), dtype=bool)
+    is_new[0] = True
+    is_new[1:] = starts[1:] > running_end[:-1] + 1
+
+    first = np.flatnonzero(is_new)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+    return starts[first], running_end[last]
+
+
+def fresh_mask(merged_starts: np.ndarray, merged_ends: np.ndarray, ingredient_ids: np.ndarray) -> np.ndarray:
+    """True for every ID inside one of the merged ranges"""
+    index = np.searchsorted(merged_starts, ingredient_ids, side="right") - 1
+    return (index >= 0) & (ingredient_ids <= merged_ends[np.maximum(index, 0)])
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "r") as file:
+        text = file.read()
+
+    start_time = perf_counter()
+    starts, ends, ingredient_ids = parse_input(text)
+    merged_starts, merged_ends = merge_ranges(starts, ends)
+    fresh_ingredients = int(np.count_nonzero(fresh_mask(merged_starts, merged_ends, ingredient_ids)))
+    valid_ingredient_ids = int((merged_ends - merged_starts + 1).sum())
+    end_time = perf_counter()
+
+    print(f"NumPy check took {end_time - start_time:.6f} seconds ({len(merged_starts)} merged ranges)")
+    print(f"Number of fresh ingredients: {fresh_ingredients}")
+    print(f"Number of valid fresh ingredients ids: {valid_ingredient_ids}")
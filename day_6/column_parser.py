@@ -0,0 +1,83 @@
+from time import perf_counter
+from math import prod
+
+import numpy as np
+
+# Column-major worksheet parser
+#
+# part2.py builds a list of characters per line and then, for every column, a list of
+# that column's characters across all rows, plus three `in` scans. Here the worksheet is
+# a 2D uint8 array (rows padded with spaces), and all the per-column work is vectorised:
+#   - Separator columns are found with one "all spaces" reduction down the columns
+#   - Problems are the runs of non-separator columns between them
+#   - The vertical (part 2) operand of every column is built for all columns at once by
+#     walking down the few rows, Horner style: value = value * 10 + digit, skipping spaces
+# Each problem's operands are then a slice of that array, and its row-wise (part 1)
+# operands are slices of the rows over the problem's columns. The per-problem Python
+# work is a constant number of slices, so wide worksheets parse in linear time.
+
+SPACE: int = ord(" ")
+ZERO: int = ord("0")
+
+
+def load_worksheet(data: bytes) -> np.ndarray:
+    """Worksheet as a (rows, columns) uint8 array, shorter rows padded with spaces"""
+    lines = [line.rstrip(b"\r") for line in data.rstrip(b"\r\n").split(b"\n")]
+    width = max(len(line) for line in lines)
+    return np.frombuffer(b"".join(line.ljust(width) for line in lines), dtype=np.uint8).reshape(len(lines), width)
+
+
+def problem_blocks(grid: np.ndarray) -> list[tuple[int, int]]:
+    """(first column, end column) of every problem, split on all-space columns"""
+    is_separator = (grid == SPACE).all(axis=0)
+    # Pad with separators either side so every block has a start and an end edge
+    edges = np.diff(np.concatenate(([True], is_separator, [True])).astype(np.int8))
+    starts = np.flatnonzero(edges == -1)
+    ends = np.flatnonzero(edges == 1)
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def column_numbers(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vertical number of every column (ignoring the operator row), and whether it has any digits"""
+    digits = grid[:-1]
+    is_digit = (digits >= ZERO) & (digits <= ZERO + 9)
+    values = np.zeros(grid.shape[1], dtype=object if len(digits) > 18 else np.int64)
+    for row, row_is_digit in zip(digits, is_digit):
+        values = np.where(row_is_digit, values * 10 + (row.astype(np.int64) - ZERO), values)
+    return values, is_digit.any(axis=0)
+
+
+def evaluate(operator: bytes, operands: list[int]) -> int:
+    if operator == b"+":
+        return sum(operands)
+    elif operator == b"*":
+        return prod(operands)
+    raise ValueError(f"Unknown operator: {operator.decode()}")
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "rb") as file:
+        grid = load_worksheet(file.read())
+
+    start_time = perf_counter()
+
+    blocks = problem_blocks(grid)
+    numbers, has_digits = column_numbers(grid)
+    rows = [row.tobytes() for row in grid[:-1]]
+    operator_row = grid[-1].tobytes()
+
+    total_part1 = 0
+    total_part2 = 0
+    for c0, c1 in blocks:
+        operator = operator_row[c0:c1].strip()
+        # Part 1: one number per row across the problem's columns
+        total_part1 += evaluate(operator, [int(row[c0:c1]) for row in rows if row[c0:c1].strip()])
+        # Part 2: one number per column, read top to bottom
+        total_part2 += evaluate(operator, [int(value) for value in numbers[c0:c1][has_digits[c0:c1]]])
+
+    end_time = perf_counter()
+
+    print(f"Column parser Execution time: {end_time - start_time:.6f} seconds ({len(blocks)} problems)")
+    print(f"Total sum of all columns (part 1): {total_part1}")
+    print(f"Total sum of all columns (part 2): {total_part2}")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from multiprocessing import Pool, cpu_count
+from time import perf_counter
+
+# Parallel problem-group evaluation
+#
+# Problems are independent once we know where they start and end, so the boundaries are
+# found first (the all-space columns), and the problems are then handed out to a process
+# pool in batches. Each worker returns the partial sums of its batch for both the
+# row-wise part 1 layout and the column-wise part 2 layout, and the parent adds them up.
+#
+# Multiplying one operand at a time (result *= num) gets slow for big numbers, as every
+# step multiplies an ever growing result by a small number. Multiplying pairs of
+# operands, then pairs of those products and so on (a balanced product tree) keeps both
+# sides of each multiplication about the same size, which Python's big-int
+# multiplication handles much better.
+
+SPACE: int = ord(" ")
+PROBLEMS_PER_WORKER: int = 4  # Batches scheduled per worker
+
+
+def product_tree(numbers: list[int]) -> int:
+    """Product of numbers, multiplied pairwise in a balanced tree"""
+    if not numbers:
+        return 1
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def evaluate(operator: bytes, operands: list[int]) -> int:
+    if operator == b"+":
+        return sum(operands)
+    elif operator == b"*":
+        return product_tree(operands)
+    raise ValueError(f"Unknown operator: {operator.decode()}")
+
+
+def problem_blocks(rows: list[bytes], width: int) -> list[tuple[int, int]]:
+    """(first column, end column) of every problem, split on all-space columns"""
+    # OR together a 0/1 "not a space" mask of every row, as one big int per row
+    not_space = bytes(0 if i == SPACE else 1 for i in range(256))
+    combined = 0
+    for row in rows:
+        combined |= int.from_bytes(row.translate(not_space), "big")
+    occupied = combined.to_bytes(width, "big")
+
+    blocks: list[tuple[int, int]] = []
+    start = None
+    for col, flag in enumerate(occupied):
+        if flag and start is None:
+            start = col
+        elif not flag and start is not None:
+            blocks.append((start, col))
+            start = None
+    if start is not None:
+        blocks.append((start, width))
+    return blocks
+
+
+def process_batch(problems: list[list[bytes]]) -> tuple[int, int]:
+    """Partial (part 1, part 2) sums for a batch of problems, each given as its row slices"""
+    total_part1 = 0
+    total_part2 = 0
+    for problem in problems:
+        *number_rows, operator_row = problem
+        operator = operator_row.strip()
+        # Part 1: one number per row
+        total_part1 += evaluate(operator, [int(row) for row in number_rows if row.strip()])
+        # Part 2: one number per column, read top to bottom
+        columns = [bytes(column) for column in zip(*number_rows)]
+        total_part2 += evaluate(operator, [int(column) for column in columns if column.strip()])
+    return total_part1, total_part2
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "rb") as file:
+        lines = [line.rstrip(b"\r\n") for line in file]
+    lines = [line for line in lines if line.strip()]
+
+    start_time = perf_counter()
+
+    # Pad lines to max length with spaces (some lines are shorter than others)
+    width = max(len(line) for line in lines)
+    rows = [line.ljust(width) for line in lines]
+
+    # Find every problem first, then batch them up for the pool
+    problems = [[row[c0:c1] for row in rows] for c0, c1 in problem_blocks(rows, width)]
+    num_batches = cpu_count() * PROBLEMS_PER_WORKER
+    batches = [problems[i::num_batches] for i in range(num_batches) if problems[i::num_batches]]
+
+    total_part1 = 0
+    total_part2 = 0
+    with Pool() as pool:
+        for part1, part2 in pool.imap_unordered(process_batch, batches):
+            total_part1 += part1
+            total_part2 += part2
+
+    end_time = perf_counter()
+
+    print(f"Parallel Execution time: {end_time - start_time:.6f} seconds ({len(problems)} problems)")
+    print(f"Total sum of all columns (part 1): {total_part1}")
+    print(f"Total sum of all columns (part 2): {total_part2}")
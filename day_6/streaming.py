@@ -0,0 +1,114 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from math import prod
+from time import perf_counter
+
+# Streaming evaluator for worksheets that are too wide to hold in memory
+#
+# Both part1.py and part2.py read every line fully before evaluating anything. Worksheets
+# only have a handful of rows though, so we can instead find where each row starts in
+# the file, open one file handle per row, and read all rows in lockstep, CHUNK_SIZE
+# columns at a time. Columns are consumed left to right, the current problem's columns
+# are collected until an all-space separator column shows up, and at that point the
+# problem is evaluated (both the row-wise part 1 operands and the column-wise part 2
+# operands) and yielded straight away.
+#
+# Memory is O(rows * (CHUNK_SIZE + widest problem)), however wide the worksheet is.
+
+CHUNK_SIZE: int = 1 << 16  # Columns read per row per step
+SPACE: int = ord(" ")
+
+
+def row_spans(path: str, block_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """(offset, length) of every row in the file, found without holding a row in memory"""
+    spans: list[tuple[int, int]] = []
+    with open(path, "rb") as file:
+        row_start = 0
+        position = 0
+        while block := file.read(block_size):
+            newline = block.find(b"\n")
+            while newline != -1:
+                spans.append((row_start, position + newline - row_start))
+                row_start = position + newline + 1
+                newline = block.find(b"\n", newline + 1)
+            position += len(block)
+        if position > row_start:
+            spans.append((row_start, position - row_start))
+        # Drop blank lines at the end of the file (empty, or just the '\r' of a CRLF ending)
+        while spans and spans[-1][1] <= 1:
+            file.seek(spans[-1][0])
+            if file.read(spans[-1][1]).strip():
+                break
+            spans.pop()
+    return spans
+
+
+def evaluate(operator: int, operands: list[int]) -> int:
+    if operator == ord("+"):
+        return sum(operands)
+    elif operator == ord("*"):
+        return prod(operands)
+    raise ValueError(f"Unknown operator: {chr(operator)}")
+
+
+def evaluate_problem(columns: list[bytes]) -> tuple[int, int]:
+    """Part 1 and part 2 results for one problem, given its columns (top to bottom, operator last)"""
+    operator = next((column[-1] for column in columns if column[-1] != SPACE), None)
+    if operator is None:
+        raise ValueError("Problem has no operator")
+    # Part 1: read each row across the problem's columns
+    rows = [bytes(column[row] for column in columns) for row in range(len(columns[0]) - 1)]
+    part1 = evaluate(operator, [int(row) for row in rows if row.strip()])
+    # Part 2: read each column top to bottom (excluding the operator row)
+    part2 = evaluate(operator, [int(column[:-1]) for column in columns if column[:-1].strip()])
+    return part1, part2
+
+
+def iter_problem_results(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[int, int]]:
+    """Yield (part 1 result, part 2 result) for every problem, left to right"""
+    spans = row_spans(path)
+    files = [open(path, "rb") for _ in spans]
+    try:
+        for file, (offset, _) in zip(files, spans):
+            file.seek(offset)
+        remaining = [length for _, length in spans]
+        widest = max(remaining, default=0)
+
+        columns: list[bytes] = []  # Columns of the problem we're in the middle of
+        for _ in range(0, widest, chunk_size):
+            # Next chunk of every row, padded with spaces where a row has already ended
+            chunks: list[bytes] = []
+            for i, file in enumerate(files):
+                size = min(chunk_size, remaining[i])
+                remaining[i] -= size
+                chunks.append(file.read(size).rstrip(b"\r").ljust(chunk_size))
+
+            for column in zip(*chunks):
+                if all(char == SPACE for char in column):
+                    if columns:
+                        yield evaluate_problem(columns)
+                        columns = []
+                else:
+                    columns.append(bytes(column))
+
+        if columns:
+            yield evaluate_problem(columns)
+    finally:
+        for file in files:
+            file.close()
+
+
+if __name__ == "__main__":
+    start_time = perf_counter()
+
+    total_part1 = 0
+    total_part2 = 0
+    for part1, part2 in iter_problem_results("./input.txt"):
+        total_part1 += part1
+        total_part2 += part2
+
+    end_time = perf_counter()
+
+    print(f"Streaming Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Total sum of all columns (part 1): {total_part1}")
+    print(f"Total sum of all columns (part 2): {total_part2}")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from bisect import bisect_right
+from time import perf_counter
+
+# Splitter graph with memoised timeline counting
+#
+# part1.py and part2.py walk every row, even though a beam only does something when it
+# hits a splitter. Here each column's splitter rows are indexed into a sorted list, so a
+# beam going down column c from row r can jump straight to the next splitter below it
+# with one bisect. That turns the manifold into a DAG of splitters:
+#   - every splitter points to the next splitter below it in the columns either side
+#     (or to the bottom, if there is none; beams leaving the grid sideways are dropped)
+#   - the splitters reachable from 'S' are the ones that split a beam (part 1)
+#   - the number of timelines through a splitter is the sum over its two targets, with
+#     the bottom counting as one (part 2)
+# Reachable splitters are found with an explicit stack, and timelines are then counted
+# bottom-up (a splitter's targets are always further down), so deep manifolds don't hit
+# the recursion limit. Indexing the splitters is one linear pass over the grid; after
+# that, walking the graph is O(splitters * log rows) (one bisect per edge) and counting
+# adds O(splitters * log splitters) for the bottom-up sort.
+
+SPLITTER: bytes = b"^"
+START: bytes = b"S"
+
+Splitter = tuple[int, int]  # (row, column)
+
+
+def index_splitters(lines: list[bytes]) -> list[list[int]]:
+    """Sorted splitter rows of every column"""
+    width = max((len(line) for line in lines), default=0)
+    columns: list[list[int]] = [[] for _ in range(width)]
+    for row, line in enumerate(lines):
+        col = line.find(SPLITTER)
+        while col != -1:
+            columns[col].append(row)  # Rows come in order, so every list stays sorted
+            col = line.find(SPLITTER, col + 1)
+    return columns
+
+
+def next_splitter(columns: list[list[int]], row: int, col: int) -> Splitter | None:
+    """First splitter below row in col, or None if the beam reaches the bottom"""
+    rows = columns[col]
+    i = bisect_right(rows, row)
+    return (rows[i], col) if i < len(rows) else None
+
+
+def count_timelines(columns: list[list[int]], start_col: int) -> tuple[int, int]:
+    """(splitters reached, timelines at the bottom) for a beam entering at start_col"""
+    first = next_splitter(columns, 0, start_col)
+    if first is None:
+        return 0, 1
+
+    # Compile the reachable part of the graph: splitter -> its targets (None is the bottom)
+    targets: dict[Splitter, list[Splitter | None]] = {}
+    stack = [first]
+    while stack:
+        splitter = stack.pop()
+        if splitter in targets:
+            continue
+        row, col = splitter
+        targets[splitter] = [
+            next_splitter(columns, row, side)
+            for side in (col - 1, col + 1)
+            if 0 <= side < len(columns)
+        ]
+        stack.extend(target for target in targets[splitter] if target is not None)
+
+    # Count bottom-up, so both targets of a splitter are known before it is
+    timelines: dict[Splitter, int] = {}
+    for splitter in sorted(targets, reverse=True):
+        timelines[splitter] = sum(1 if target is None else timelines[target] for target in targets[splitter])
+    return len(targets), timelines[first]
+
+
+if __name__ == "__main__":
+    # Read input from file
+    with open("./input.txt", "rb") as file:
+        lines = [line.rstrip() for line in file]
+
+    start_time = perf_counter()
+
+    # First line holds 'S' as starting 'beam'
+    if not lines or START not in lines[0]:
+        # Not like this will happen
+        raise ValueError("First line must contain starting 'S'")
+
+    columns = index_splitters(lines)
+    split_count, total_particles = count_timelines(columns, lines[0].index(START))
+
+    end_time = perf_counter()
+    print(f"Splitter graph Execution time: {end_time - start_time:.6f} seconds")
+    print(f"Number of splits encountered: {split_count}")
+    print(f"Total number of particles at the bottom: {total_particles}")